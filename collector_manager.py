@@ -1,18 +1,18 @@
+import io
 import os
 import sys
 import shutil
 import zipfile
 import winrm
 import paramiko
-import hashlib
 import warnings
 import json
-import queue
 import threading
 import time
 import logging
 from pathlib import Path
 from datetime import datetime
+from collections import deque
 import pytz
 from typing import Tuple, Optional, Dict, Any, List, Set
 from urllib.parse import unquote
@@ -21,12 +21,48 @@ from config import Config, init_directories, get_winrm_credentials
 from colors import print_success, print_error, print_info, print_warning, SUCCESS_EMOJI, ERROR_EMOJI, logger
 import re
 import subprocess
-from process_zip_files import process_single_zip, check_process_single_zip
+from concurrent.futures import ThreadPoolExecutor
+from text_utils import sniff_encoding
+from remote_utils import (
+    create_winrm_session, open_ssh_client, execute_command, check_execution_output,
+    upload_and_verify_file, OUTPUT_WAIT_SECONDS, PULL_WORKERS
+)
+from process_zip_files import process_single_zip, check_process_single_zip, extract_system_info, parallel_walk, write_json_lines, VERBOSE, REQUIRED_KEYS, EXCLUDED_RESULT_FILES
 
 # Suppress deprecation warnings
 warnings.filterwarnings('ignore', category=CryptographyDeprecationWarning)
 warnings.filterwarnings('ignore', message='.*TripleDES.*')
 
+# Bytes read from the end of a result file to find its last two lines
+PREVIEW_TAIL_SIZE = 8192
+
+# Most result previews kept by get_results before the cache is reset
+PREVIEW_CACHE_LIMIT = 4096
+
+# Seconds /status may serve the same results list while runtime_zip is unchanged
+RESULTS_CACHE_TTL = 1.0
+
+# Most recent status messages kept for the web interface
+STATUS_MESSAGE_LIMIT = 500
+
+def walk_files(root: str):
+    """Yield a DirEntry for every file under root, in the same order as os.walk"""
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    subdirs = []
+    for entry in entries:
+        # Like os.walk, symlinked directories are listed but not descended into
+        if entry.is_dir():
+            if not entry.is_symlink():
+                subdirs.append(entry.path)
+        else:
+            yield entry
+    for subdir in subdirs:
+        yield from walk_files(subdir)
+
 class SpecFileGenerator:
     """A highly customizable generator for Velociraptor artifact specification files."""
     
@@ -81,6 +117,7 @@ class SpecFileGenerator:
         
         # Initialize state
         self.template_encoding = None
+        self._template_cache = {}
         
         # Log configuration
         print_info(f"Template path: {self.template_path}")
@@ -95,7 +132,10 @@ class SpecFileGenerator:
 
     def try_read_file(self, file_path: str, specific_encoding: str = None) -> Tuple[Optional[List[str]], Optional[str]]:
         """
-        Try to read a file with different encodings or a specific encoding.
+        Read a file once and decode it, choosing the encoding from its byte order mark.
+        
+        UTF-16 and UTF-8 files are recognised by their BOM; anything else is tried as UTF-8
+        and then the remaining configured encodings.
         
         Args:
             file_path: Path to the file to read
@@ -106,19 +146,36 @@ class SpecFileGenerator:
         """
         print_info(f"\nAttempting to read {file_path}")
         
-        encodings_to_try = [specific_encoding] if specific_encoding else self.encodings
+        try:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+        except Exception as e:
+            print_error(f"Error reading file {file_path}: {e}")
+            return None, None
+        
+        # Decode the bytes already in memory; a BOM settles the encoding without trial decodes
+        if specific_encoding:
+            encodings_to_try = [specific_encoding]
+        else:
+            sniffed = sniff_encoding(data)
+            if sniffed == 'utf-16':
+                encodings_to_try = [sniffed]
+            else:
+                encodings_to_try = [sniffed] + [e for e in self.encodings if e not in ('utf-16', 'utf-8', sniffed)]
         
         for encoding in encodings_to_try:
             try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    lines = f.readlines()
-                    print_success(f"Successfully read {len(lines)} lines with {encoding}")
-                    return lines, encoding
+                text = data.decode(encoding)
             except UnicodeError:
                 print_info(f"{encoding} encoding failed, trying next...")
                 continue
-            except Exception as e:
+            except LookupError as e:
                 print_error(f"Error reading file {file_path} with {encoding}: {e}")
+                continue
+            # Split with the same universal-newline handling as a text-mode readlines()
+            lines = io.StringIO(text, newline=None).readlines()
+            print_success(f"Successfully read {len(lines)} lines with {encoding}")
+            return lines, encoding
         
         print_error(f"Failed to read {file_path} with any encoding")
         return None, None
@@ -158,6 +215,46 @@ class SpecFileGenerator:
         
         return start, end
 
+    def load_template(self, encoding: str = None, custom_markers: Tuple[str, str] = None) -> Optional[Tuple[List[str], List[str]]]:
+        """
+        Read the template and split it into header and footer lines around the artifacts section.
+        
+        The split is cached per (encoding, markers), so generating many specs reads and scans the template once.
+        
+        Args:
+            encoding: Specific encoding to read the template with
+            custom_markers: Tuple of (start_marker, end_marker) to split on
+            
+        Returns:
+            Tuple of (header_lines, footer_lines) or None if the template cannot be used
+        """
+        cache_key = (encoding, custom_markers)
+        cached = self._template_cache.get(cache_key)
+        if cached is not None:
+            header_lines, footer_lines, self.template_encoding = cached
+            return header_lines, footer_lines
+
+        # Read template file
+        print_info(f"Reading template file: {self.template_path}")
+        template_lines, template_encoding = self.try_read_file(self.template_path, encoding)
+        if not template_lines:
+            print_error("Failed to read template file")
+            return None
+
+        # Find section markers using custom markers if provided
+        start_marker, end_marker = custom_markers or (None, None)
+        start, end = self.find_section_markers(template_lines, start_marker, end_marker)
+        if start == -1 or end == -1:
+            print_error("Could not find section markers in template")
+            return None
+
+        # Split template into header and footer
+        header_lines = template_lines[:start + 2]
+        footer_lines = template_lines[end:]
+        self._template_cache[cache_key] = (header_lines, footer_lines, template_encoding)
+        self.template_encoding = template_encoding
+        return header_lines, footer_lines
+
     def create_spec_file(self, 
                         artifact: str, 
                         custom_config: Dict[str, Any] = None,
@@ -187,22 +284,11 @@ class SpecFileGenerator:
                 os.makedirs(output_dir)
                 print_success(f"Created output directory: {output_dir}")
 
-            # Read template file
-            print_info(f"Reading template file: {self.template_path}")
-            template_lines, self.template_encoding = self.try_read_file(self.template_path, encoding)
-            if not template_lines:
-                print_error("Failed to read template file")
-                return None
-
-            # Find section markers
-            start, end = self.find_section_markers(template_lines)
-            if start == -1 or end == -1:
-                print_error("Could not find section markers in template")
+            # Split template into header and footer (read once per generator)
+            template = self.load_template(encoding)
+            if not template:
                 return None
-
-            # Split template into header and footer
-            header_lines = template_lines[:start + 2]
-            footer_lines = template_lines[end:]
+            header_lines, footer_lines = template
 
             # Create the new content
             new_content = header_lines.copy()
@@ -231,9 +317,11 @@ class SpecFileGenerator:
             print_info(f"Content length: {len(new_content)} lines")
             
             # Write the file with specified or detected encoding
+            # Join and encode the spec once so it goes out in a single write
             file_encoding = encoding or self.template_encoding or 'utf-8'
-            with open(spec_path, 'w', newline='', encoding=file_encoding) as spec_file:
-                spec_file.writelines(new_content)
+            payload = "".join(new_content).encode(file_encoding)
+            with open(spec_path, 'wb') as spec_file:
+                spec_file.write(payload)
             
             print_success(f"Successfully created spec file for {artifact}")
             return spec_path
@@ -273,23 +361,11 @@ class SpecFileGenerator:
                 os.makedirs(output_dir)
                 print_success(f"Created output directory: {output_dir}")
 
-            # Read template file
-            print_info(f"Reading template file: {self.template_path}")
-            template_lines, self.template_encoding = self.try_read_file(self.template_path, encoding)
-            if not template_lines:
-                print_error("Failed to read template file")
-                return None
-
-            # Find section markers using custom markers if provided
-            start_marker, end_marker = custom_markers or (None, None)
-            start, end = self.find_section_markers(template_lines, start_marker, end_marker)
-            if start == -1 or end == -1:
-                print_error("Could not find section markers in template")
+            # Split template into header and footer using custom markers if provided
+            template = self.load_template(encoding, custom_markers)
+            if not template:
                 return None
-
-            # Split template into header and footer
-            header_lines = template_lines[:start + 2]
-            footer_lines = template_lines[end:]
+            header_lines, footer_lines = template
 
             # Create the new content
             new_content = header_lines.copy()
@@ -318,9 +394,11 @@ class SpecFileGenerator:
             print_info(f"Content length: {len(new_content)} lines")
             
             # Write the file with specified or detected encoding
+            # Join and encode the spec once so it goes out in a single write
             file_encoding = encoding or self.template_encoding or 'utf-8'
-            with open(spec_path, 'w', newline='', encoding=file_encoding) as spec_file:
-                spec_file.writelines(new_content)
+            payload = "".join(new_content).encode(file_encoding)
+            with open(spec_path, 'wb') as spec_file:
+                spec_file.write(payload)
             
             print_success(f"Successfully created combined spec file with {len(artifacts)} artifacts")
             return spec_path
@@ -335,22 +413,35 @@ class CollectorManager:
         print_info(f"\nInitializing CollectorManager in {mode} mode")
         logger.info(f"Initializing CollectorManager in {mode} mode")
         self.mode = mode
-        self.progress_queue = queue.Queue()
+        # Guards the messages deque, which the worker appends to while request threads snapshot it
+        self._status_lock = threading.Lock()
+        # Bumped on every status change; /events streams wait on the condition for it to move past
+        # the version they last sent, so every stream wakes on each change
+        self._status_changed = threading.Condition(self._status_lock)
+        self.status_version = 0
+        # Time of each thread's last status message, so the collector build running alongside
+        # a push reports its own step times instead of the time since the other thread's message
+        self._task_clock = threading.local()
         self.status = {
             'processing': False,
             'total_artifacts': 0,
             'processed': 0,
             'current_artifact': '',
-            'messages': [],
+            'messages': deque(maxlen=STATUS_MESSAGE_LIMIT),
             'completed': False,
-            'task_start_time': None,
             'artifact_stats': {
                 'successful': [],
                 'failed': []
-            }
+            },
+            'artifact_execution_time': 0.0
         }
         self.winrm_session = None
         self.credentials = None
+        self._spec_generator = None
+        # Result previews keyed on path, reused while the file's mtime and size are unchanged
+        self._preview_cache: Dict[str, Tuple[int, int, List[str]]] = {}
+        # (built at, runtime_zip mtime, results) from the last get_cached_results rebuild
+        self._results_cache: Optional[Tuple[float, int, List[Dict[str, Any]]]] = None
         print_success("CollectorManager initialized successfully")
         logger.debug("CollectorManager initialized with empty status")
 
@@ -409,7 +500,7 @@ class CollectorManager:
                 self.update_status(f"Missing required credentials: {', '.join(missing_vars)}", True)
                 return False
             
-            self.winrm_session = self.create_winrm_session(self.credentials)
+            self.winrm_session = create_winrm_session(self.credentials)
             logger.info("Successfully initialized connections")
             return True
         except Exception as e:
@@ -417,21 +508,28 @@ class CollectorManager:
             self.update_status(f"Failed to initialize connections: {str(e)}", True)
             return False
 
+    def get_spec_generator(self) -> SpecFileGenerator:
+        """Return the spec generator for the configured paths, reusing it (and its parsed template) across artifacts"""
+        paths = (
+            Config.get('ARTIFACT_TEMPLATE_PATH'),
+            Config.get('ARTIFACT_LIST_FILE'),
+            Config.get('ARTIFACT_SPECS_DIR')
+        )
+        if self._spec_generator is None or self._spec_generator[0] != paths:
+            self._spec_generator = (paths, SpecFileGenerator(*paths))
+        return self._spec_generator[1]
+
     def create_artifact_spec(self, artifact_name: str) -> Optional[str]:
         """Create spec file for a single artifact"""
         logger.info(f"Creating spec for artifact: {artifact_name}")
         try:
             self.update_status(f"Creating spec for {artifact_name}")
             
-            spec_generator = SpecFileGenerator(
-                Config.get('ARTIFACT_TEMPLATE_PATH'),
-                Config.get('ARTIFACT_LIST_FILE'),
-                Config.get('ARTIFACT_SPECS_DIR')
-            )
+            spec_generator = self.get_spec_generator()
             
-            logger.debug(f"Template path: {Config.get('ARTIFACT_TEMPLATE_PATH')}")
-            logger.debug(f"Artifact list: {Config.get('ARTIFACT_LIST_FILE')}")
-            logger.debug(f"Specs directory: {Config.get('ARTIFACT_SPECS_DIR')}")
+            logger.debug(f"Template path: {spec_generator.template_path}")
+            logger.debug(f"Artifact list: {spec_generator.artifacts_path}")
+            logger.debug(f"Specs directory: {spec_generator.output_dir}")
             
             spec_path = spec_generator.create_spec_file(artifact_name)
             if spec_path:
@@ -454,18 +552,24 @@ class CollectorManager:
         try:
             self.update_status(f"Building collector for {artifact_name}")
             
+            # Read the build settings once for this build
+            velo_binary = Config.get('VELO_BINARY_PATH')
+            velo_config = Config.get('VELO_SERVER_CONFIG')
+            velo_datastore = Config.get('VELO_DATASTORE')
+            collectors_dir = Config.get('ARTIFACT_COLLECTORS_DIR')
+            
             # Log all config values
             print_info("\nConfiguration values:")
-            print_info(f"VELO_BINARY_PATH: {Config.get('VELO_BINARY_PATH')}")
-            print_info(f"VELO_SERVER_CONFIG: {Config.get('VELO_SERVER_CONFIG')}")
-            print_info(f"VELO_DATASTORE: {Config.get('VELO_DATASTORE')}")
-            print_info(f"ARTIFACT_COLLECTORS_DIR: {Config.get('ARTIFACT_COLLECTORS_DIR')}")
+            print_info(f"VELO_BINARY_PATH: {velo_binary}")
+            print_info(f"VELO_SERVER_CONFIG: {velo_config}")
+            print_info(f"VELO_DATASTORE: {velo_datastore}")
+            print_info(f"ARTIFACT_COLLECTORS_DIR: {collectors_dir}")
             
             logger.debug("Config values:")
-            logger.debug(f"VELO_BINARY_PATH: {Config.get('VELO_BINARY_PATH')}")
-            logger.debug(f"VELO_SERVER_CONFIG: {Config.get('VELO_SERVER_CONFIG')}")
-            logger.debug(f"VELO_DATASTORE: {Config.get('VELO_DATASTORE')}")
-            logger.debug(f"ARTIFACT_COLLECTORS_DIR: {Config.get('ARTIFACT_COLLECTORS_DIR')}")
+            logger.debug(f"VELO_BINARY_PATH: {velo_binary}")
+            logger.debug(f"VELO_SERVER_CONFIG: {velo_config}")
+            logger.debug(f"VELO_DATASTORE: {velo_datastore}")
+            logger.debug(f"ARTIFACT_COLLECTORS_DIR: {collectors_dir}")
             
             # Ensure spec file exists
             if not os.path.exists(spec_path):
@@ -475,14 +579,13 @@ class CollectorManager:
                 return None
 
             # Create collectors directory if it doesn't exist
-            collectors_dir = Config.get('ARTIFACT_COLLECTORS_DIR')
             print_info(f"Creating collectors directory: {collectors_dir}")
             logger.debug(f"Creating collectors directory: {collectors_dir}")
             os.makedirs(collectors_dir, exist_ok=True)
             
             # Define source and target collector paths
             source_collector = os.path.join(
-                Config.get('VELO_DATASTORE'),
+                velo_datastore,
                 "Collector_velociraptor-v0.72.4-windows-amd64.exe"
             )
             
@@ -499,10 +602,6 @@ class CollectorManager:
             logger.debug(f"Target collector path: {target_collector}")
             
             # Build the command with full paths
-            velo_binary = Config.get('VELO_BINARY_PATH')
-            velo_config = Config.get('VELO_SERVER_CONFIG')
-            velo_datastore = Config.get('VELO_DATASTORE')
-            
             if not os.path.exists(velo_binary):
                 print_error(f"Velociraptor binary not found: {velo_binary}")
                 logger.error(f"Velociraptor binary not found: {velo_binary}")
@@ -531,7 +630,8 @@ class CollectorManager:
                     cmd,
                     capture_output=True,
                     text=True,
-                    check=False  # Don't raise exception on non-zero exit
+                    check=False,  # Don't raise exception on non-zero exit
+                    close_fds=False  # Allows posix_spawn instead of fork+exec; our fds are non-inheritable
                 )
                 print_info(f"Build command result code: {result.returncode}")
                 logger.debug(f"Build command result: {result.returncode}")
@@ -626,7 +726,9 @@ class CollectorManager:
                 if ($LASTEXITCODE -ne $null -and $LASTEXITCODE -ne 0) {{
                     throw "Process exited with code $LASTEXITCODE"
                 }}
-                "Success"
+                $deadline = (Get-Date).AddSeconds({OUTPUT_WAIT_SECONDS})
+                while (-not (Test-Path -LiteralPath '{log_file}') -and (Get-Date) -lt $deadline) {{ Start-Sleep -Milliseconds 100 }}
+                if (Test-Path -LiteralPath '{log_file}') {{ "Success" }} else {{ "OutputMissing" }}
             }} catch {{
                 Write-Error "Failed to execute: $_"
                 throw
@@ -634,21 +736,15 @@ class CollectorManager:
             """
             
             logger.debug("Executing PowerShell command for collector")
-            result = self.execute_command(self.winrm_session, ps_command)
+            result = execute_command(self.winrm_session, ps_command)
+            if result['status_code'] == 0 and "OutputMissing" in result['stdout']:
+                error_msg = f"File {log_file} not found after execution"
+                logger.error(error_msg)
+                self.update_status(error_msg, True)
+                return False
             if result['status_code'] == 0 and "Success" in result['stdout']:
                 logger.info("Collector execution completed successfully")
                 self.update_status("Execution completed")
-                
-                logger.debug("Waiting for file operations to complete")
-                self.winrm_session.run_ps("Start-Sleep -Seconds 2")
-                
-                logger.debug(f"Checking for log file: {log_file}")
-                check_file = self.winrm_session.run_ps(f"Test-Path '{log_file}'")
-                if check_file.std_out.decode('utf-8').strip().lower() != 'true':
-                    error_msg = f"File {log_file} not found after execution"
-                    logger.error(error_msg)
-                    self.update_status(error_msg, True)
-                    return False
                 logger.info("Log file found on remote system")
                 
                 self.update_status(f"Pulling log file {log_file}...")
@@ -674,7 +770,7 @@ class CollectorManager:
                     
                     self.update_status("Verifying execution output...")
                     logger.info("Starting execution output verification")
-                    if self.check_execution_output(local_path):
+                    if check_execution_output(local_path):
                         success_msg = "Execution verification completed successfully"
                         logger.info(success_msg)
                         self.update_status(success_msg)
@@ -735,17 +831,6 @@ class CollectorManager:
         """
         print_info(f"\nValidating processed files for: {zip_path.name}")
         
-        # Define required keys
-        required_keys = {
-            'source_type',
-            'Hostname',
-            'OS',
-            'Platform',
-            'PlatformVersion',
-            'Fqdn',
-            'MACAddresses'
-        }
-        
         # Use provided runtime_zip_dir or default
         if runtime_zip_dir is None:
             runtime_zip_dir = Path('runtime_zip')
@@ -758,55 +843,57 @@ class CollectorManager:
             print_error(f"Results directory not found for {zip_path.name}")
             return False
         
-        basic_info_filename = 'Generic.Client.Info.BasicInformation.json'
         issues_found = False
         
-        # Process each JSON file
-        for file_path in results_dir.glob('*.json'):
-            if file_path.name == basic_info_filename:
-                continue
-                
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    lines = [line.strip() for line in f if line.strip()]
+        # Process each JSON file, reading names straight from the directory instead of globbing Paths
+        with os.scandir(results_dir) as entries:
+            for entry in entries:
+                file_name = entry.name
+                if not file_name.endswith('.json') or file_name in EXCLUDED_RESULT_FILES:
+                    continue
+            
+                expected_source_type = self.get_source_type(file_name)
                 
-                for line_number, line in enumerate(lines, 1):
-                    try:
-                        json_obj = json.loads(line)
+                try:
+                    # Parse each non-empty line as it is read instead of holding the whole file as a list
+                    with open(entry.path, 'rb') as f:
+                        non_empty_lines = (line for line in f if not line.isspace())
+                        for line_number, line in enumerate(non_empty_lines, 1):
+                            try:
+                                json_obj = json.loads(line)
                         
-                        # Verify source_type matches filename
-                        expected_source_type = self.get_source_type(file_path.name)
-                        actual_source_type = json_obj.get('source_type')
-                        if actual_source_type != expected_source_type:
-                            issues_found = True
-                            print_error(f"Issue in {file_path.name}, line {line_number}:")
-                            print_error(f"  - Incorrect source_type: expected '{expected_source_type}', got '{actual_source_type}'")
+                                # Verify source_type matches filename
+                                actual_source_type = json_obj.get('source_type')
+                                if actual_source_type != expected_source_type:
+                                    issues_found = True
+                                    print_error(f"Issue in {file_name}, line {line_number}:")
+                                    print_error(f"  - Incorrect source_type: expected '{expected_source_type}', got '{actual_source_type}'")
                         
-                        # Check for missing required keys
-                        missing_keys = required_keys - set(json_obj.keys())
-                        if missing_keys:
-                            issues_found = True
-                            print_error(f"Issue in {file_path.name}, line {line_number}:")
-                            print_error(f"  - Missing required keys: {', '.join(sorted(missing_keys))}")
+                                # Check for missing required keys
+                                missing_keys = REQUIRED_KEYS.difference(json_obj.keys())
+                                if missing_keys:
+                                    issues_found = True
+                                    print_error(f"Issue in {file_name}, line {line_number}:")
+                                    print_error(f"  - Missing required keys: {', '.join(sorted(missing_keys))}")
                         
-                        # Check for empty values
-                        empty_keys = {
-                            key for key in required_keys - missing_keys
-                            if json_obj.get(key) is None or json_obj.get(key) == ''
-                        }
-                        if empty_keys:
-                            issues_found = True
-                            print_error(f"Issue in {file_path.name}, line {line_number}:")
-                            print_error(f"  - Empty values for keys: {', '.join(sorted(empty_keys))}")
+                                # Check for empty values
+                                empty_keys = [
+                                    key for key in REQUIRED_KEYS
+                                    if key not in missing_keys and json_obj[key] in (None, '')
+                                ]
+                                if empty_keys:
+                                    issues_found = True
+                                    print_error(f"Issue in {file_name}, line {line_number}:")
+                                    print_error(f"  - Empty values for keys: {', '.join(sorted(empty_keys))}")
                         
-                    except json.JSONDecodeError:
-                        issues_found = True
-                        print_error(f"Issue in {file_path.name}, line {line_number}:")
-                        print_error("  - Invalid JSON format")
+                            except json.JSONDecodeError:
+                                issues_found = True
+                                print_error(f"Issue in {file_name}, line {line_number}:")
+                                print_error("  - Invalid JSON format")
                         
-            except Exception as e:
-                issues_found = True
-                print_error(f"Error processing {file_path.name}: {str(e)}")
+                except Exception as e:
+                    issues_found = True
+                    print_error(f"Error processing {file_name}: {str(e)}")
         
         if not issues_found:
             print_success(f"Validation successful: No issues found in {zip_path.name}")
@@ -824,47 +911,35 @@ class CollectorManager:
     def rename_files_in_directory(self, directory: Path) -> None:
         """Rename files and directories replacing '%2F' with '.'"""
         print_info(f"Renaming files in {directory}")
+        renamed = {"file": [], "directory": []}
         
-        # First rename all files (collect paths first to avoid modification during iteration)
-        files_to_rename = []
-        for item in directory.rglob('*'):
-            if item.is_file() and '%2F' in item.name:
-                files_to_rename.append(item)
-        
-        # Rename the files
-        for old_path in files_to_rename:
+        def rename_entry(entry: os.DirEntry, kind: str) -> str:
+            if '%2F' not in entry.name:
+                return entry.path
+            new_name = entry.name.replace('%2F', '.')
+            new_path = os.path.join(os.path.dirname(entry.path), new_name)
+            if os.path.exists(new_path):
+                print_warning(f"Skipping {entry.name} - {new_name} already exists")
+                return entry.path
             try:
-                new_name = old_path.name.replace('%2F', '.')
-                new_path = old_path.parent / new_name
-                if new_path.exists():
-                    print_warning(f"Skipping {old_path.name} - {new_name} already exists")
-                    continue
-                old_path.rename(new_path)
-                print_info(f"Renamed file: {old_path.name} -> {new_name}")
+                os.rename(entry.path, new_path)
+                renamed[kind].append(new_path)
+                if VERBOSE:
+                    logger.info(f"Renamed {kind}: {entry.name} -> {new_name}")
+                return new_path
             except Exception as e:
-                print_error(f"Error renaming {old_path.name}: {str(e)}")
+                print_error(f"Error renaming {kind} {entry.name}: {str(e)}")
+                return entry.path
         
-        # Then rename directories bottom-up (collect paths first to avoid modification during iteration)
-        dirs_to_rename = []
-        for item in directory.rglob('*'):
-            if item.is_dir() and '%2F' in item.name:
-                dirs_to_rename.append(item)
+        def rename_file(entry: os.DirEntry) -> None:
+            rename_entry(entry, "file")
         
-        # Sort directories by depth (deepest first) to handle nested paths
-        dirs_to_rename.sort(key=lambda x: len(x.parts), reverse=True)
+        def rename_dir(entry: os.DirEntry) -> str:
+            return rename_entry(entry, "directory")
         
-        # Rename the directories
-        for old_path in dirs_to_rename:
-            try:
-                new_name = old_path.name.replace('%2F', '.')
-                new_path = old_path.parent / new_name
-                if new_path.exists():
-                    print_warning(f"Skipping {old_path.name} - {new_name} already exists")
-                    continue
-                old_path.rename(new_path)
-                print_info(f"Renamed directory: {old_path.name} -> {new_name}")
-            except Exception as e:
-                print_error(f"Error renaming directory {old_path.name}: {str(e)}")
+        # Directories are renamed before descending so their contents are still visited
+        parallel_walk(directory, rename_file, dir_fn=rename_dir)
+        print_info(f"Renamed {len(renamed['file'])} files and {len(renamed['directory'])} directories")
 
     def process_basic_information(self, extract_dir: Path) -> Optional[Dict[str, Any]]:
         """Process basic information file and extract system info"""
@@ -883,22 +958,7 @@ class CollectorManager:
 
     def extract_system_info(self, basic_info: Dict[str, Any]) -> Dict[str, Any]:
         """Extract system information from BasicInformation.json"""
-        keys_to_extract = ['Hostname', 'OS', 'Platform', 'PlatformVersion', 'Fqdn', 'MACAddresses']
-        system_info = {}
-        
-        def search_dict(d: Dict[str, Any], target_keys: List[str]) -> None:
-            for key, value in d.items():
-                if key in target_keys:
-                    system_info[key] = value
-                elif isinstance(value, dict):
-                    search_dict(value, target_keys)
-                elif isinstance(value, list):
-                    for item in value:
-                        if isinstance(item, dict):
-                            search_dict(item, target_keys)
-        
-        search_dict(basic_info, keys_to_extract)
-        return system_info
+        return extract_system_info(basic_info)
 
     def get_source_type(self, filename: str) -> str:
         """Extract source type from filename"""
@@ -915,6 +975,7 @@ class CollectorManager:
             return
         
         print_info("\nUpdating JSON files with system information...")
+        updated_count = 0
         for file_path in results_dir.glob('*.json'):
             if file_path.name == 'Generic.Client.Info.BasicInformation.json':
                 continue
@@ -935,13 +996,16 @@ class CollectorManager:
                     except json.JSONDecodeError:
                         updated_lines.append(line)
                 
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write('\n'.join(updated_lines) + '\n')
+                write_json_lines(file_path, updated_lines)
                 
-                print_success(f"Updated: {file_path.name}")
+                updated_count += 1
+                if VERBOSE:
+                    logger.info(f"Updated: {file_path.name}")
                 
             except Exception as e:
                 print_error(f"Error updating {file_path.name}: {str(e)}")
+        
+        print_success(f"Updated {updated_count} files with source type and system info")
 
     def add_timestamps_to_json_files(self, extract_dir: Path) -> None:
         """Add epoch timestamps to JSON files"""
@@ -969,12 +1033,16 @@ class CollectorManager:
             "ctime",
             "atime"
         ]
+        time_indicators = tuple(time_key.lower() for time_key in possible_time_keys)
         
         print_info("\nAdding timestamps to JSON files...")
+        epoch_count = 0
+        converted_count = 0
         for file_path in results_dir.glob('*.json'):
             if file_path.name != 'Generic.Client.Info.BasicInformation.json':
-                self.add_epoch_timestamps(file_path, timestamp_keys)
-                self.detect_and_convert_timestamps(file_path, possible_time_keys)
+                epoch_count += self.add_epoch_timestamps(file_path, timestamp_keys)
+                converted_count += self.detect_and_convert_timestamps(file_path, time_indicators)
+        print_success(f"Added epoch timestamps in {epoch_count} files, auto-detected timestamps in {converted_count} files")
 
     def convert_iso_to_epoch(self, timestamp_str: str) -> Optional[int]:
         """Convert ISO format timestamp to epoch"""
@@ -985,8 +1053,8 @@ class CollectorManager:
         except (ValueError, TypeError):
             return None
 
-    def add_epoch_timestamps(self, file_path: Path, timestamp_keys: List[str]) -> None:
-        """Add epoch timestamps for specified keys"""
+    def add_epoch_timestamps(self, file_path: Path, timestamp_keys: List[str]) -> bool:
+        """Add epoch timestamps for specified keys, returns True if the file was rewritten"""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 lines = [line.strip() for line in f if line.strip()]
@@ -1004,60 +1072,82 @@ class CollectorManager:
                 except json.JSONDecodeError:
                     updated_lines.append(line)
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(updated_lines) + '\n')
+            write_json_lines(file_path, updated_lines)
             
-            print_success(f"Added epoch timestamps in: {file_path.name}")
+            if VERBOSE:
+                logger.info(f"Added epoch timestamps in: {file_path.name}")
+            return True
             
         except Exception as e:
             print_error(f"Error adding epoch timestamps in {file_path.name}: {str(e)}")
+            return False
 
-    def detect_and_convert_timestamps(self, file_path: Path, possible_time_keys: List[str]) -> None:
-        """Auto-detect and convert timestamp values"""
+    def detect_and_convert_timestamps(self, file_path: Path, time_indicators: Tuple[str, ...]) -> bool:
+        """Auto-detect and convert timestamp values for keys containing any lowercase time indicator, returns True if any were converted"""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 lines = [line.strip() for line in f if line.strip()]
             
             updated_lines = []
             conversions_made = False
+            # Candidate timestamp keys cached per key layout, usually computed once per file
+            candidates_by_layout: Dict[Tuple[str, ...], List[str]] = {}
             
             for line in lines:
                 try:
                     json_obj = json.loads(line)
-                    for key in list(json_obj.keys()):
-                        if any(time_indicator.lower() in key.lower() for time_indicator in possible_time_keys):
-                            if f"{key}_epoch" in json_obj:
-                                continue
-                            if isinstance(json_obj[key], str):
-                                epoch_time = self.convert_iso_to_epoch(json_obj[key])
-                                if epoch_time is not None:
-                                    json_obj[f"{key}_epoch"] = epoch_time
-                                    conversions_made = True
+                    layout = tuple(json_obj)
+                    candidate_keys = candidates_by_layout.get(layout)
+                    if candidate_keys is None:
+                        candidate_keys = [
+                            key for key in layout
+                            if any(time_indicator in key.lower() for time_indicator in time_indicators)
+                        ]
+                        candidates_by_layout[layout] = candidate_keys
+                    for key in candidate_keys:
+                        epoch_key = f"{key}_epoch"
+                        if epoch_key in json_obj:
+                            continue
+                        value = json_obj[key]
+                        if isinstance(value, str):
+                            epoch_time = self.convert_iso_to_epoch(value)
+                            if epoch_time is not None:
+                                json_obj[epoch_key] = epoch_time
+                                conversions_made = True
                     updated_lines.append(json.dumps(json_obj))
                 except json.JSONDecodeError:
                     updated_lines.append(line)
             
             if conversions_made:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write('\n'.join(updated_lines) + '\n')
-                print_success(f"Auto-detected and converted timestamps in: {file_path.name}")
+                write_json_lines(file_path, updated_lines)
+                if VERBOSE:
+                    logger.info(f"Auto-detected and converted timestamps in: {file_path.name}")
+            return conversions_made
             
         except Exception as e:
             print_error(f"Error auto-detecting timestamps in {file_path.name}: {str(e)}")
+            return False
 
     def delete_index_files(self, directory: Path) -> None:
         """Delete all .index files"""
         print_info("\nDeleting .index files...")
-        for root, _, files in os.walk(directory):
-            root_path = Path(root)
-            for file in files:
-                if file.endswith('.index'):
-                    file_path = root_path / file
-                    try:
-                        file_path.unlink()
-                        print_success(f"Deleted: {file_path}")
-                    except Exception as e:
-                        print_error(f"Error deleting {file_path}: {str(e)}")
+        
+        def delete_index(entry: os.DirEntry) -> Optional[bool]:
+            if not entry.name.endswith('.index'):
+                return None
+            try:
+                os.unlink(entry.path)
+                if VERBOSE:
+                    logger.info(f"Deleted: {entry.path}")
+                return True
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print_error(f"Error deleting {entry.path}: {str(e)}")
+            return None
+        
+        deleted = parallel_walk(directory, delete_index)
+        print_success(f"Deleted {len(deleted)} .index files")
 
     def update_artifact_statistics(self, artifact_name: str, success: bool, execution_time: float) -> None:
         """Update statistics for processed artifact"""
@@ -1067,12 +1157,16 @@ class CollectorManager:
             'timestamp': time.strftime('%H:%M:%S')
         }
         
-        if success:
-            self.status['artifact_stats']['successful'].append(artifact_info)
-        else:
-            self.status['artifact_stats']['failed'].append(artifact_info)
+        # Keep the running total with the lists so runtime stats never re-sum them
+        with self._status_lock:
+            if success:
+                self.status['artifact_stats']['successful'].append(artifact_info)
+            else:
+                self.status['artifact_stats']['failed'].append(artifact_info)
+            self.status['artifact_execution_time'] += execution_time
         
         self.status['processed'] += 1
+        self.notify_status_changed()
 
     def process_single_artifact(self, artifact_name: str, build_collectors: bool) -> bool:
         """Process a single artifact through all steps"""
@@ -1111,6 +1205,57 @@ class CollectorManager:
             self.update_artifact_statistics(artifact_name, False, time.time() - start_time)
             return False
 
+    def process_artifacts_pipelined(self, artifacts: List[str]) -> bool:
+        """
+        Build and run a collector for each artifact, building the next collector while the current one runs remotely.
+        Builds stay one at a time because they share VELO_DATASTORE, and pushes stay one at a time because they
+        share the WinRM session and the runtime directory.
+        """
+        def build(artifact_name: str) -> Tuple[float, Optional[str]]:
+            start_time = time.time()
+            try:
+                print_info(f"\nStarting to process artifact: {artifact_name}")
+                print_info("\nStep 1: Creating artifact spec")
+                spec_path = self.create_artifact_spec(artifact_name)
+                if not spec_path:
+                    return time.time() - start_time, None
+                print_info("\nStep 2: Building collector executable")
+                collector_path = self.build_collector_exe(artifact_name, spec_path)
+                return time.time() - start_time, collector_path
+            except Exception as e:
+                print_error(f"Error processing artifact {artifact_name}: {str(e)}")
+                return time.time() - start_time, None
+        
+        if not artifacts:
+            return True
+        
+        overall_success = True
+        with ThreadPoolExecutor(max_workers=1) as builder:
+            pending = builder.submit(build, artifacts[0])
+            for index, artifact_name in enumerate(artifacts):
+                build_time, collector_path = pending.result()
+                if index + 1 < len(artifacts):
+                    pending = builder.submit(build, artifacts[index + 1])
+                
+                start_time = time.time()
+                success = False
+                if collector_path:
+                    try:
+                        print_info(f"\nStep 3: Pushing and executing collector for {artifact_name}")
+                        success = self.push_and_execute_collector(collector_path, artifact_name)
+                    except Exception as e:
+                        print_error(f"Error processing artifact {artifact_name}: {str(e)}")
+                
+                # Time spent waiting on the other stage is not counted against the artifact
+                execution_time = build_time + (time.time() - start_time)
+                self.update_artifact_statistics(artifact_name, success, execution_time)
+                if success:
+                    print_success(f"\nSuccessfully processed {artifact_name} in {execution_time:.2f} seconds")
+                else:
+                    logger.warning(f"Failed to process artifact: {artifact_name}")
+                    overall_success = False
+        return overall_success
+
     def execute_remote_exe(self, session, exe_path, file_to_pull, credentials):
         """
         Execute the remote exe file and pull back the specified result file
@@ -1140,7 +1285,10 @@ class CollectorManager:
                     throw "Process exited with code $LASTEXITCODE"
                 }}
                 
-                "Success"
+                # Poll for the output file server-side so a late handle release costs no extra round-trip
+                $deadline = (Get-Date).AddSeconds({OUTPUT_WAIT_SECONDS})
+                while (-not (Test-Path -LiteralPath '{file_to_pull}') -and (Get-Date) -lt $deadline) {{ Start-Sleep -Milliseconds 100 }}
+                if (Test-Path -LiteralPath '{file_to_pull}') {{ "Success" }} else {{ "OutputMissing" }}
             }} catch {{
                 Write-Error "Failed to execute: $_"
                 throw
@@ -1148,18 +1296,14 @@ class CollectorManager:
             """
             
             result = session.run_ps(ps_command)
+            output = result.std_out.decode('utf-8')
+            
+            if result.status_code == 0 and "OutputMissing" in output:
+                print_error(f"File {file_to_pull} not found after execution")
+                return False
             
-            if result.status_code == 0 and "Success" in result.std_out.decode('utf-8'):
+            if result.status_code == 0 and "Success" in output:
                 print_success(f"Execution completed")
-                
-                # Wait a moment to ensure file is ready
-                session.run_ps("Start-Sleep -Seconds 2")
-                
-                # Check if the file exists before trying to pull it
-                check_file = session.run_ps(f"Test-Path '{file_to_pull}'")
-                if check_file.std_out.decode('utf-8').strip().lower() != 'true':
-                    print_error(f"File {file_to_pull} not found after execution")
-                    return False
                     
                 print_info(f"\nPulling file {file_to_pull}...")
                 
@@ -1186,7 +1330,7 @@ class CollectorManager:
                     
                     # Check the output file
                     print_info("\nVerifying execution output...")
-                    if self.check_execution_output(local_path):
+                    if check_execution_output(local_path):
                         # After successful log file pull, pull the collection zip files
                         print_info("\nPulling Collection zip files...")
                         collection_pattern = "C:\\Windows\\Temp\\Collection-*.zip"
@@ -1207,21 +1351,6 @@ class CollectorManager:
             print_error(f"Failed to execute file or pull results: {str(e)}")
             return False
 
-    def check_execution_output(self, output_file):
-        """Check if the execution was successful by looking for 'Exiting' in the output"""
-        try:
-            with open(output_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                if "Exiting" in content:
-                    print_success("Execution verification passed: Found 'Exiting' in output")
-                    return True
-                else:
-                    print_error("Execution verification failed: 'Exiting' not found in output")
-                    return False
-        except Exception as e:
-            print_error(f"Failed to read output file: {str(e)}")
-            return False
-
     def run(self, artifacts: Optional[List[str]] = None, build_collectors: bool = False) -> bool:
         """Main entry point for running the collector manager"""
         try:
@@ -1286,12 +1415,15 @@ class CollectorManager:
             
             # Process each artifact
             logger.info("Starting artifact processing")
-            overall_success = True
-            for artifact in artifacts:
-                logger.debug(f"Processing artifact: {artifact} with build_collectors={build_collectors}")
-                if not self.process_single_artifact(artifact, build_collectors):
-                    logger.warning(f"Failed to process artifact: {artifact}")
-                    overall_success = False
+            if build_collectors:
+                overall_success = self.process_artifacts_pipelined(artifacts)
+            else:
+                overall_success = True
+                for artifact in artifacts:
+                    logger.debug(f"Processing artifact: {artifact} with build_collectors={build_collectors}")
+                    if not self.process_single_artifact(artifact, build_collectors):
+                        logger.warning(f"Failed to process artifact: {artifact}")
+                        overall_success = False
             
             # After all artifacts are processed, pull all zip files at once
             if build_collectors and overall_success:
@@ -1316,43 +1448,48 @@ class CollectorManager:
         finally:
             self.status['processing'] = False
             self.status['completed'] = True
-            self.status['task_start_time'] = None
+            self._task_clock.start_time = None
+            self.notify_status_changed()
             
             if self.winrm_session:
                 logger.debug("Cleaning up remote files")
                 self.cleanup_remote_files(self.winrm_session)
 
     def update_status(self, message: str, is_error: bool = False) -> None:
-        """Update processing status and send to queue"""
+        """Update processing status and wake anything waiting for a status change"""
         current_time = time.time()
         elapsed = ""
         
-        if self.status['task_start_time'] is not None:
-            elapsed = f"(took {current_time - self.status['task_start_time']:.2f}s)"
+        task_start_time = getattr(self._task_clock, 'start_time', None)
+        if task_start_time is not None:
+            elapsed = f"(took {current_time - task_start_time:.2f}s)"
+        self._task_clock.start_time = current_time
         
-        self.status['task_start_time'] = current_time
-        
-        status_update = {
-            'message': message,
-            'timestamp': time.strftime('%H:%M:%S'),
-            'type': 'error' if is_error else 'info',
-            'elapsed': elapsed
-        }
+        with self._status_lock:
+            status_update = {
+                'message': message,
+                'timestamp': time.strftime('%H:%M:%S'),
+                'type': 'error' if is_error else 'info',
+                'elapsed': elapsed
+            }
+            self.status['messages'].append(status_update)
+            self.status_version += 1
+            self._status_changed.notify_all()
         
         log_level = logging.ERROR if is_error else logging.INFO
         logger.log(log_level, f"{message} {elapsed}")
-        
-        self.progress_queue.put(status_update)
-        self.status['messages'].append(status_update)
-
-    def create_winrm_session(self, credentials: Dict[str, str]) -> winrm.Session:
-        """Create a WinRM session"""
-        return winrm.Session(
-            credentials['host'],
-            auth=(credentials['username'], credentials['password']),
-            transport='ntlm',
-            server_cert_validation='ignore'
-        )
+
+    def notify_status_changed(self) -> None:
+        """Record a status change and wake everything waiting in wait_for_status_change"""
+        with self._status_changed:
+            self.status_version += 1
+            self._status_changed.notify_all()
+
+    def wait_for_status_change(self, last_version: int, timeout: float) -> int:
+        """Wait until the status version moves past last_version or the timeout expires, and return the current version"""
+        with self._status_changed:
+            self._status_changed.wait_for(lambda: self.status_version > last_version, timeout)
+            return self.status_version
 
     def create_ssh_client(self, credentials: Dict[str, str]) -> Optional[paramiko.SSHClient]:
         """Create SSH client"""
@@ -1385,16 +1522,8 @@ class CollectorManager:
             logger.info(f"Port: {credentials.get('ssh_port', 22)}")
             logger.debug("Password: [REDACTED]")  # Don't log the actual password
             
-            ssh = paramiko.SSHClient()
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            
             logger.info("Attempting SSH connection...")
-            ssh.connect(
-                credentials['host'],
-                port=int(credentials.get('ssh_port', 22)),
-                username=credentials['username'],
-                password=credentials['password']
-            )
+            ssh = open_ssh_client(credentials)
             logger.info("SSH connection established successfully")
             return ssh
         except Exception as e:
@@ -1402,72 +1531,6 @@ class CollectorManager:
             self.update_status(f"Failed to establish SSH connection: {str(e)}", True)
             return None
 
-    def execute_command(self, session: winrm.Session, command: str) -> Dict[str, Any]:
-        """Execute a command via WinRM"""
-        result = session.run_ps(command)
-        return {
-            'status_code': result.status_code,
-            'stdout': result.std_out.decode('utf-8'),
-            'stderr': result.std_err.decode('utf-8')
-        }
-
-    def verify_file_integrity(self, winrm_session, local_path, remote_path):
-        """Verify file integrity by comparing size and hash"""
-        try:
-            # Get local file details
-            local_size = os.path.getsize(local_path)
-            local_hash = self.get_file_hash(local_path)
-            
-            # Get remote file details using WinRM
-            size_result = winrm_session.run_ps(f'(Get-Item "{remote_path}").Length')
-            if size_result.status_code != 0:
-                print_error(f"Failed to get remote file size")
-                return False
-                
-            remote_size = int(size_result.std_out.decode('utf-8').strip())
-            
-            # Compare sizes
-            if local_size != remote_size:
-                print_error(f"Size verification failed: Local {local_size:,} bytes, Remote {remote_size:,} bytes")
-                return False
-            
-            # Get and compare hashes
-            remote_hash = self.get_remote_file_hash(winrm_session, remote_path)
-            
-            if not remote_hash:
-                print_error(f"Failed to get remote file hash")
-                return False
-                
-            if local_hash.lower() != remote_hash.lower():
-                print_error(f"Hash verification failed")
-                return False
-                
-            print_success(f"File integrity verified (SHA256: {local_hash})")
-            return True
-            
-        except Exception as e:
-            print_error(f"Verification failed: {str(e)}")
-            return False
-
-    def get_file_hash(self, file_path: str) -> str:
-        """Calculate SHA256 hash of a file"""
-        sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
-
-    def get_remote_file_hash(self, session: winrm.Session, file_path: str) -> Optional[str]:
-        """Get remote file hash"""
-        ps_command = f"""
-        $hash = Get-FileHash -Path '{file_path}' -Algorithm SHA256
-        $hash.Hash.ToLower()
-        """
-        result = session.run_ps(ps_command)
-        if result.status_code == 0:
-            return result.std_out.decode('utf-8').strip()
-        return None
-
     def process_files(self, input_dir: str = 'runtime', output_dir: str = 'runtime_zip', mode: str = 'collection') -> bool:
         """Process files in input directory and save results to output directory"""
         try:
@@ -1540,9 +1603,9 @@ class CollectorManager:
         
         try:
             init_directories()
-            winrm_session = self.create_winrm_session(credentials)
+            winrm_session = create_winrm_session(credentials)
             
-            result = self.execute_command(winrm_session, 'whoami')
+            result = execute_command(winrm_session, 'whoami')
             
             if result['status_code'] == 0:
                 print_success(f"Command output: {result['stdout']}")
@@ -1566,43 +1629,79 @@ class CollectorManager:
 
     def get_status(self) -> Dict[str, Any]:
         """Get current status information"""
-        while not self.progress_queue.empty():
-            try:
-                self.progress_queue.get_nowait()
-            except queue.Empty:
-                break
-
-        status_copy = self.status.copy()
-        status_copy['results'] = self.get_results() if self.status['completed'] else []
+        # Take a consistent snapshot; the worker thread keeps appending while this is serialised
+        with self._status_lock:
+            status_copy = self.status.copy()
+            status_copy['messages'] = list(self.status['messages'])
+            status_copy['artifact_stats'] = {
+                key: list(value) for key, value in self.status['artifact_stats'].items()
+            }
+        status_copy['results'] = self.get_cached_results() if self.status['completed'] else []
         return status_copy
 
+    def get_cached_results(self) -> List[Dict[str, Any]]:
+        """Get processing results, rebuilt at most once per RESULTS_CACHE_TTL unless runtime_zip changes"""
+        now = time.monotonic()
+        try:
+            root_mtime = os.stat('runtime_zip').st_mtime_ns
+        except OSError:
+            root_mtime = 0
+        cached = self._results_cache
+        if cached and now - cached[0] < RESULTS_CACHE_TTL and cached[1] == root_mtime:
+            return cached[2]
+        results = self.get_results()
+        self._results_cache = (now, root_mtime, results)
+        return results
+
     def get_results(self) -> List[Dict[str, Any]]:
         """Get processing results"""
         results = []
         runtime_zip_path = 'runtime_zip'
         if os.path.exists(runtime_zip_path):
-            for root, _, files in os.walk(runtime_zip_path):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    result = {'path': file_path}
-                    
-                    if file.endswith('.json'):
-                        try:
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                lines = f.readlines()
-                                last_two = lines[-2:] if len(lines) >= 2 else lines
-                                result['preview'] = [line.strip() for line in last_two]
-                        except Exception as e:
-                            result['preview'] = [f"Error reading file: {str(e)}"]
-                    results.append(result)
+            for entry in walk_files(runtime_zip_path):
+                result = {'path': entry.path}
+                
+                if entry.name.endswith('.json'):
+                    try:
+                        result['preview'] = self.get_json_preview(entry.path, entry.stat())
+                    except Exception as e:
+                        result['preview'] = [f"Error reading file: {str(e)}"]
+                results.append(result)
         return results
 
+    def get_json_preview(self, file_path: str, stat: Optional[os.stat_result] = None) -> List[str]:
+        """Get the last two lines of a result file, cached until the file changes"""
+        if stat is None:
+            stat = os.stat(file_path)
+        cached = self._preview_cache.get(file_path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        
+        # Only read the end of the file, widening the window until it holds two whole lines
+        window = PREVIEW_TAIL_SIZE
+        with open(file_path, 'rb') as f:
+            while True:
+                start = max(0, stat.st_size - window)
+                f.seek(start)
+                lines = f.read().splitlines()
+                # Unless the window reaches the start of the file its first line may be partial
+                if start == 0 or len(lines) > 2:
+                    break
+                window *= 2
+        preview = [line.decode('utf-8', 'replace').strip() for line in lines[-2:]]
+        
+        if len(self._preview_cache) >= PREVIEW_CACHE_LIMIT:
+            self._preview_cache.clear()
+        self._preview_cache[file_path] = (stat.st_mtime_ns, stat.st_size, preview)
+        return preview
+
     def stop_processing(self) -> None:
         """Stop current processing if running"""
         if self.status['processing']:
             self.update_status("Stopping processing by user request...")
             self.status['processing'] = False
             self.status['completed'] = True
+            self.notify_status_changed()
             
             # Clean up any active connections
             if self.winrm_session:
@@ -1625,7 +1724,7 @@ class CollectorManager:
             ps_command = f"""
             Get-ChildItem -Path '{remote_pattern}' | Select-Object -ExpandProperty FullName
             """
-            result = self.execute_command(self.winrm_session, ps_command)
+            result = execute_command(self.winrm_session, ps_command)
             
             if result['status_code'] != 0:
                 self.update_status("Failed to list files matching pattern", True)
@@ -1642,25 +1741,30 @@ class CollectorManager:
             if not ssh:
                 return False
                 
-            try:
-                sftp = ssh.open_sftp()
-                
-                for remote_path in files:
+            def pull(remote_path):
+                try:
+                    local_filename = os.path.basename(remote_path)
+                    local_path = os.path.join(local_dir, local_filename)
+                    
+                    self.update_status(f"Pulling file {remote_path}...")
+                    # Each download gets its own SFTP channel on the shared connection
+                    sftp = ssh.open_sftp()
                     try:
-                        local_filename = os.path.basename(remote_path)
-                        local_path = os.path.join(local_dir, local_filename)
-                        
-                        self.update_status(f"Pulling file {remote_path}...")
                         sftp.get(remote_path, local_path)
-                        self.update_status(f"File pulled successfully to {local_path}")
-                    except Exception as e:
-                        self.update_status(f"Failed to pull {remote_path}: {str(e)}", True)
-                        continue
+                    finally:
+                        sftp.close()
+                    self.update_status(f"File pulled successfully to {local_path}")
+                except Exception as e:
+                    self.update_status(f"Failed to pull {remote_path}: {str(e)}", True)
+            
+            try:
+                # Download the files, several at a time
+                with ThreadPoolExecutor(max_workers=min(PULL_WORKERS, len(files))) as executor:
+                    list(executor.map(pull, files))
                         
                 return True
                     
             finally:
-                sftp.close()
                 ssh.close()
                 
         except Exception as e:
@@ -1693,7 +1797,7 @@ class CollectorManager:
                 }}
                 """
                 
-                result = self.execute_command(session, ps_command)
+                result = execute_command(session, ps_command)
                 if result['status_code'] == 0:
                     if result['stdout']:
                         print_info(f"Cleanup results for {pattern}:")
@@ -1716,13 +1820,12 @@ class CollectorManager:
 
     def copy_and_verify_file(self, winrm_session, credentials, local_path, remote_path):
         """
-        Copy a file to the remote host using SSH/SCP and verify its presence
+        Copy a file to the remote host using SSH/SCP and verify its presence.
         """
         try:
             logger.info(f"Starting file copy operation")
             logger.debug(f"Local path: {local_path}")
             logger.debug(f"Remote path: {remote_path}")
-            print_info(f"Copying file to {remote_path}...")
             
             # Create SSH client
             logger.debug("Initializing SSH client")
@@ -1732,43 +1835,22 @@ class CollectorManager:
                 return False
                 
             try:
-                # Create SFTP client
+                # Upload over one SFTP channel, hashing the bytes as they are sent, then verify them
                 logger.debug("Creating SFTP client")
                 sftp = ssh.open_sftp()
-                
-                # Get file size and calculate chunks for progress
-                file_size = os.path.getsize(local_path)
-                logger.debug(f"File size: {file_size / (1024*1024):.2f} MB")
-                print_info(f"File size: {file_size / (1024*1024):.2f} MB")
-                
-                def progress_callback(sent, total):
-                    if sent % (1024*1024) == 0:  # Log every 1MB
-                        progress = (sent/total*100)
-                        logger.debug(f"Transfer progress: {progress:.1f}% ({sent}/{total} bytes)")
-                        print_info(f"Progress: {progress:.1f}%")
-                
-                # Copy the file
-                logger.debug("Starting file transfer")
-                sftp.put(local_path, remote_path, callback=progress_callback)
-                logger.info("File transfer completed")
-                
-                # Verify file integrity
-                logger.debug("Starting file integrity verification")
-                verification_result = self.verify_file_integrity(winrm_session, local_path, remote_path)
-                if verification_result:
-                    logger.info("File integrity verification passed")
-                else:
-                    logger.error("File integrity verification failed")
-                return verification_result
-                    
-            except Exception as e:
-                logger.error(f"SFTP operation failed: {str(e)}", exc_info=True)
-                print_error(f"File transfer failed: {str(e)}")
-                return False
+                try:
+                    verification_result = upload_and_verify_file(winrm_session, sftp, local_path, remote_path)
+                finally:
+                    sftp.close()
             finally:
-                logger.debug("Closing SFTP and SSH connections")
-                sftp.close()
+                logger.debug("Closing SSH connection")
                 ssh.close()
+            
+            if verification_result:
+                logger.info("File transfer and integrity verification passed")
+            else:
+                logger.error("File transfer or integrity verification failed")
+            return verification_result
                 
         except Exception as e:
             logger.error(f"File transfer failed: {str(e)}", exc_info=True)
@@ -1787,7 +1869,7 @@ class CollectorManager:
         try:
             # Check if file exists on remote system
             check_file = session.run_ps(f"Test-Path '{remote_path}'")
-            if check_file.std_out.decode('utf-8').strip().lower() != 'true':
+            if check_file.std_out.strip().lower() != b'true':
                 print_error(f"Remote file not found: {remote_path}")
                 return False
 
@@ -1905,7 +1987,7 @@ class CollectorManager:
             }}
             """
             
-            result = self.execute_command(session, ps_command)
+            result = execute_command(session, ps_command)
             if result['status_code'] == 0:
                 if "Successfully deleted" in result['stdout']:
                     print_success("Remote file deleted successfully")
@@ -1928,15 +2010,11 @@ class CollectorManager:
         try:
             self.update_status(f"Creating combined spec for {len(artifacts)} artifacts")
             
-            spec_generator = SpecFileGenerator(
-                Config.get('ARTIFACT_TEMPLATE_PATH'),
-                Config.get('ARTIFACT_LIST_FILE'),
-                Config.get('ARTIFACT_SPECS_DIR')
-            )
+            spec_generator = self.get_spec_generator()
             
-            logger.debug(f"Template path: {Config.get('ARTIFACT_TEMPLATE_PATH')}")
-            logger.debug(f"Artifact list: {Config.get('ARTIFACT_LIST_FILE')}")
-            logger.debug(f"Specs directory: {Config.get('ARTIFACT_SPECS_DIR')}")
+            logger.debug(f"Template path: {spec_generator.template_path}")
+            logger.debug(f"Artifact list: {spec_generator.artifacts_path}")
+            logger.debug(f"Specs directory: {spec_generator.output_dir}")
             
             # Generate a unique spec name if not provided
             if not spec_name:
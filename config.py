@@ -47,6 +47,8 @@ class Config:
         'COLLECTOR_FILE': os.path.join('datastore', 'Collector_velociraptor-v0.72.4-windows-amd64.exe'),
         'VELO_BINARY_PATH': os.path.join('binaries', 'velociraptor-v0.72.4-windows-amd64.exe'),
         'VELO_SERVER_CONFIG': os.path.join('datastore', 'server.config.yaml'),
+        # Local file hashes keyed on path, mtime and size; survives runtime directory cleanups
+        'HASH_CACHE_FILE': os.path.join('datastore', 'hashcache.json'),
         
         # Artifact Testing Configuration
         'ARTIFACT_TEMPLATE_PATH': os.path.join('specs', 'test.yaml'),
@@ -56,7 +58,10 @@ class Config:
         
         # Runtime Directories
         'RUNTIME_DIR': 'runtime',
-        'RUNTIME_ZIP_DIR': 'runtime_zip'
+        'RUNTIME_ZIP_DIR': 'runtime_zip',
+        
+        # Print per-file progress while post-processing collections
+        'VERBOSE': 'false'
     }
 
 # Convenience functions for commonly used paths
@@ -72,6 +77,10 @@ def get_velociraptor_path() -> str:
 def get_server_config() -> str:
     return Config.get('VELO_SERVER_CONFIG')
 
+def is_verbose() -> bool:
+    """Whether per-item progress output is enabled"""
+    return Config.get('VERBOSE').strip().lower() in ('1', 'true', 'yes')
+
 def get_winrm_credentials() -> dict:
     """Get WinRM credentials as a dictionary"""
     return {
@@ -1,13 +1,44 @@
 import os
-import shutil
+import sys
+import argparse
 import zipfile
 from pathlib import Path
 import re
 import json
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from urllib.parse import unquote
-from typing import Tuple, Optional, Dict, Any, List, Set
+from typing import Tuple, Optional, Dict, Any, List, Set, Callable
 from datetime import datetime
 import pytz
+from config import is_verbose
+
+logger = logging.getLogger(__name__)
+
+# Per-item progress lines are only emitted when VERBOSE is enabled;
+# otherwise each step prints a single summary line
+VERBOSE = is_verbose()
+
+# Number of threads used to walk extracted collections
+WALK_WORKERS = 16
+
+# Rewrites of files up to this size are built in memory and written in one call;
+# larger files are streamed line by line
+MAX_BUFFERED_REWRITE_SIZE = 256 * 1024 * 1024
+
+# Keys that must be present and non-empty in every processed JSON line
+REQUIRED_KEYS = frozenset({
+    'source_type',
+    'Hostname',
+    'OS',
+    'Platform',
+    'PlatformVersion',
+    'Fqdn',
+    'MACAddresses'
+})
+
+# Result files that are not artifact output and are skipped during validation
+EXCLUDED_RESULT_FILES = frozenset({'Generic.Client.Info.BasicInformation.json'})
 
 def create_directory(directory: Path) -> None:
     """Create directory if it doesn't exist."""
@@ -24,12 +55,6 @@ def extract_filename_info(filename: str) -> Tuple[Optional[str], Optional[str]]:
     print("Expected format: Collection--%FQDN%--%TIMESTAMP%.zip")
     return None, None
 
-def copy_zip_file(source: Path, dest_dir: Path) -> Path:
-    """Copy zip file to destination directory and return destination path."""
-    dest_path = dest_dir / source.name
-    shutil.copy2(source, dest_path)
-    return dest_path
-
 def extract_zip_file(zip_path: Path, extract_dir: Path) -> bool:
     """Extract zip file to specified directory.
     Returns True if successful, False otherwise."""
@@ -42,37 +67,89 @@ def extract_zip_file(zip_path: Path, extract_dir: Path) -> bool:
         print(f"Error extracting {zip_path.name}: {str(e)}")
         return False
 
+def _scan_directory(directory: str,
+                    file_fn: Callable[[os.DirEntry], Any],
+                    dir_fn: Optional[Callable[[os.DirEntry], str]]) -> Tuple[List[str], List[Any]]:
+    """Scan a single directory and return (subdirectories to descend into, non-None file_fn results)."""
+    subdirs = []
+    results = []
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError as e:
+        print(f"Error scanning {directory}: {str(e)}")
+        return subdirs, results
+    
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            subdirs.append(dir_fn(entry) if dir_fn else entry.path)
+        else:
+            result = file_fn(entry)
+            if result is not None:
+                results.append(result)
+    return subdirs, results
+
+def parallel_walk(root: Path,
+                  file_fn: Callable[[os.DirEntry], Any],
+                  workers: int = WALK_WORKERS,
+                  dir_fn: Optional[Callable[[os.DirEntry], str]] = None) -> List[Any]:
+    """
+    Walk root with a pool of threads, calling file_fn for every file entry.
+    If dir_fn is given it is called for each directory before descending and
+    returns the path to descend into (e.g. after renaming it).
+    Returns the non-None results of file_fn.
+    """
+    results = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(_scan_directory, str(root), file_fn, dir_fn)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                subdirs, file_results = future.result()
+                results.extend(file_results)
+                for subdir in subdirs:
+                    pending.add(pool.submit(_scan_directory, subdir, file_fn, dir_fn))
+    return results
+
 def rename_files_in_directory(directory: Path) -> None:
     """
-    Recursively rename all files in directory, replacing '%2F' with '.'
+    Recursively rename all files and directories in directory, replacing '%2F' with '.'
+    Directories are renamed before they are descended into, so a single pass covers the tree.
     """
     print("Renaming files to replace '%2F' with '.'...")
-    for root, dirs, files in os.walk(directory):
-        root_path = Path(root)
-        
-        # Rename files
-        for file in files:
-            if '%2F' in file:
-                old_path = root_path / file
-                new_name = file.replace('%2F', '.')
-                new_path = root_path / new_name
-                try:
-                    old_path.rename(new_path)
-                    print(f"Renamed: {file} -> {new_name}")
-                except Exception as e:
-                    print(f"Error renaming {file}: {str(e)}")
-        
-        # Rename directories
-        for dir_name in dirs:
-            if '%2F' in dir_name:
-                old_dir_path = root_path / dir_name
-                new_dir_name = dir_name.replace('%2F', '.')
-                new_dir_path = root_path / new_dir_name
-                try:
-                    old_dir_path.rename(new_dir_path)
-                    print(f"Renamed directory: {dir_name} -> {new_dir_name}")
-                except Exception as e:
-                    print(f"Error renaming directory {dir_name}: {str(e)}")
+    
+    renamed_dirs = []
+    
+    def rename_file(entry: os.DirEntry) -> Optional[bool]:
+        if '%2F' not in entry.name:
+            return None
+        new_name = entry.name.replace('%2F', '.')
+        try:
+            os.rename(entry.path, os.path.join(os.path.dirname(entry.path), new_name))
+            if VERBOSE:
+                logger.info(f"Renamed: {entry.name} -> {new_name}")
+            return True
+        except Exception as e:
+            print(f"Error renaming {entry.name}: {str(e)}")
+            return None
+    
+    def rename_dir(entry: os.DirEntry) -> str:
+        if '%2F' not in entry.name:
+            return entry.path
+        new_name = entry.name.replace('%2F', '.')
+        new_path = os.path.join(os.path.dirname(entry.path), new_name)
+        try:
+            os.rename(entry.path, new_path)
+            renamed_dirs.append(new_path)
+            if VERBOSE:
+                logger.info(f"Renamed directory: {entry.name} -> {new_name}")
+            return new_path
+        except Exception as e:
+            print(f"Error renaming directory {entry.name}: {str(e)}")
+            return entry.path
+    
+    renamed_files = parallel_walk(directory, rename_file, dir_fn=rename_dir)
+    print(f"Renamed {len(renamed_files)} files and {len(renamed_dirs)} directories")
 
 def read_basic_info(extract_dir: Path) -> Optional[dict]:
     """Read and parse the BasicInformation.json file."""
@@ -90,54 +167,47 @@ def read_basic_info(extract_dir: Path) -> Optional[dict]:
         print(f"Error reading BasicInformation.json: {str(e)}")
     return None
 
-def collect_system_info(json_data: Dict[str, Any]) -> Dict[str, Any]:
+SYSTEM_INFO_KEYS = ('Hostname', 'OS', 'Platform', 'PlatformVersion', 'Fqdn', 'MACAddresses')
+
+def _nested_items(value: Any):
     """
-    Extract specific system information from a JSON file.
+    Return an iterator over the items a system info search descends into: the items of a dict,
+    or the items of each dict in a list (in order). Returns None for anything else.
     """
-    keys_to_extract = {
-        'Hostname': None,
-        'OS': None,
-        'Platform': None,
-        'PlatformVersion': None,
-        'Fqdn': None,
-        'MACAddresses': None
-    }
-    
-    def search_dict(d: Dict[str, Any], target_keys: Dict[str, Any]) -> None:
-        for key, value in d.items():
-            if key in target_keys and target_keys[key] is None:
-                target_keys[key] = value
-            elif isinstance(value, dict):
-                search_dict(value, target_keys)
-            elif isinstance(value, list):
-                for item in value:
-                    if isinstance(item, dict):
-                        search_dict(item, target_keys)
-    
-    search_dict(json_data, keys_to_extract)
-    return {k: v for k, v in keys_to_extract.items() if v is not None}
+    if isinstance(value, dict):
+        return iter(value.items())
+    if isinstance(value, list):
+        return (pair for item in value if isinstance(item, dict) for pair in item.items())
+    return None
 
-def read_all_json_files(directory: Path) -> Dict[str, Any]:
+def collect_system_info(json_data: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Read all JSON files in the directory and collect system information.
+    Extract specific system information from a JSON file.
+    Each key takes the first non-None value met in a depth-first, pre-order walk;
+    the walk stops as soon as every key has one.
     """
-    system_info = {}
-    
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith('.json'):
-                file_path = Path(root) / file
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        json_data = json.load(f)
-                        info = collect_system_info(json_data)
-                        if info:
-                            print(f"Found system information in: {file}")
-                            system_info.update(info)
-                except Exception as e:
-                    print(f"Error reading {file}: {str(e)}")
+    keys_to_extract = dict.fromkeys(SYSTEM_INFO_KEYS)
+    missing = len(keys_to_extract)
+    # Stack of item iterators instead of recursion, one per dict/list being walked
+    stack = [iter(json_data.items())]
+    
+    while stack and missing:
+        for key, value in stack[-1]:
+            if key in keys_to_extract and keys_to_extract[key] is None:
+                keys_to_extract[key] = value
+                if value is not None:
+                    missing -= 1
+                    if not missing:
+                        break
+            else:
+                children = _nested_items(value)
+                if children is not None:
+                    stack.append(children)
+                    break
+        else:
+            stack.pop()
     
-    return system_info
+    return {k: v for k, v in keys_to_extract.items() if v is not None}
 
 def display_basic_info(json_data: dict, system_info: Dict[str, Any] = None) -> None:
     """Display the basic information and system information in a formatted way."""
@@ -175,23 +245,24 @@ def display_basic_info(json_data: dict, system_info: Dict[str, Any] = None) -> N
 
 def extract_system_info(basic_info: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Extract system information from BasicInformation.json
+    Extract system information from BasicInformation.json.
+    Walks the whole structure depth-first; the last value met for each key wins, including None.
     """
-    keys_to_extract = ['Hostname', 'OS', 'Platform', 'PlatformVersion', 'Fqdn', 'MACAddresses']
     system_info = {}
+    stack = [iter(basic_info.items())]
     
-    def search_dict(d: Dict[str, Any], target_keys: List[str]) -> None:
-        for key, value in d.items():
-            if key in target_keys:
+    while stack:
+        for key, value in stack[-1]:
+            if key in SYSTEM_INFO_KEYS:
                 system_info[key] = value
-            elif isinstance(value, dict):
-                search_dict(value, target_keys)
-            elif isinstance(value, list):
-                for item in value:
-                    if isinstance(item, dict):
-                        search_dict(item, target_keys)
+            else:
+                children = _nested_items(value)
+                if children is not None:
+                    stack.append(children)
+                    break
+        else:
+            stack.pop()
     
-    search_dict(basic_info, keys_to_extract)
     return system_info
 
 def get_source_type(filename: str) -> str:
@@ -204,39 +275,30 @@ def get_source_type(filename: str) -> str:
     # Return the last part as source type
     return parts[-1] if parts else 'Unknown'
 
-def update_json_with_source_type(file_path: Path) -> None:
+def write_json_lines(file_path: Path, lines: List[str]) -> None:
     """
-    Add source_type to each JSON line based on the filename.
+    Replace file_path with the given JSON lines.
+    The content is written to a temporary file next to it and swapped in with os.replace,
+    so a failed rewrite never leaves a truncated results file behind.
     """
-    source_type = get_source_type(file_path.name)
-    
+    tmp_path = file_path.with_name(file_path.name + '.tmp')
+    newline = os.linesep.encode('utf-8')
     try:
-        # Read all lines from the file
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = [line.strip() for line in f if line.strip()]
-        
-        # Process each line and add source_type
-        updated_lines = []
-        for line in lines:
-            try:
-                # Parse the JSON object from the line
-                json_obj = json.loads(line)
-                # Add source_type to the object
-                json_obj['source_type'] = source_type
-                # Convert back to JSON string
-                updated_lines.append(json.dumps(json_obj))
-            except json.JSONDecodeError:
-                # If line is not valid JSON, keep it as is
-                updated_lines.append(line)
-        
-        # Write the updated lines back to the file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(updated_lines) + '\n')
-        
-        print(f"Added source_type '{source_type}' to: {file_path.name}")
-        
-    except Exception as e:
-        print(f"Error updating source_type in {file_path.name}: {str(e)}")
+        with open(tmp_path, 'wb') as f:
+            if file_path.stat().st_size <= MAX_BUFFERED_REWRITE_SIZE:
+                buffer = bytearray()
+                for line in lines:
+                    buffer += line.encode('utf-8')
+                    buffer += newline
+                f.write(buffer)
+            else:
+                for line in lines:
+                    f.write(line.encode('utf-8'))
+                    f.write(newline)
+        os.replace(tmp_path, file_path)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 def update_json_with_system_info(extract_dir: Path, system_info: Dict[str, Any]) -> None:
     """
@@ -250,27 +312,26 @@ def update_json_with_system_info(extract_dir: Path, system_info: Dict[str, Any])
     basic_info_filename = 'Generic.Client.Info.BasicInformation.json'
     
     print("\nUpdating JSON files with system information...")
+    updated_count = 0
     for file_path in results_dir.glob('*.json'):
         # Skip the BasicInformation.json file
         if file_path.name == basic_info_filename:
             continue
             
         try:
-            # First add source_type to each line
-            update_json_with_source_type(file_path)
+            source_type = get_source_type(file_path.name)
             
-            # Then add system info
             # Read all lines from the file
             with open(file_path, 'r', encoding='utf-8') as f:
                 lines = [line.strip() for line in f if line.strip()]
             
-            # Process each line and add system info
+            # Add source_type and system info to each line in a single pass
             updated_lines = []
             for line in lines:
                 try:
                     # Parse the JSON object from the line
                     json_obj = json.loads(line)
-                    # Add system info to the object
+                    json_obj['source_type'] = source_type
                     json_obj.update(system_info)
                     # Convert back to JSON string
                     updated_lines.append(json.dumps(json_obj))
@@ -279,23 +340,26 @@ def update_json_with_system_info(extract_dir: Path, system_info: Dict[str, Any])
                     updated_lines.append(line)
             
             # Write the updated lines back to the file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(updated_lines) + '\n')
+            write_json_lines(file_path, updated_lines)
             
-            print(f"Updated with system info: {file_path.name}")
+            updated_count += 1
+            if VERBOSE:
+                logger.info(f"Updated with source_type '{source_type}' and system info: {file_path.name}")
             
         except Exception as e:
             print(f"Error updating {file_path.name}: {str(e)}")
+    
+    print(f"Updated {updated_count} files with source type and system info")
 
-def setup_extraction_directory(zip_path: Path, runtime_zip_dir: Path) -> Tuple[Path, Path]:
+def setup_extraction_directory(zip_path: Path, runtime_zip_dir: Path) -> Path:
     """
     Set up the directory for zip extraction.
-    Returns tuple of (destination zip path, extraction directory path)
+    The zip is extracted in place from its source location, so it is not copied.
+    Returns the extraction directory path
     """
-    dest_path = copy_zip_file(zip_path, runtime_zip_dir)
     extract_dir = runtime_zip_dir / zip_path.stem
     create_directory(extract_dir)
-    return dest_path, extract_dir
+    return extract_dir
 
 def process_file_info(zip_path: Path) -> None:
     """
@@ -325,16 +389,23 @@ def process_basic_information(extract_dir: Path) -> Optional[Dict[str, Any]]:
 def delete_index_files(directory: Path) -> None:
     """Delete all .index files in the specified directory and its subdirectories."""
     print("\nDeleting .index files...")
-    for root, _, files in os.walk(directory):
-        root_path = Path(root)
-        for file in files:
-            if file.endswith('.index'):
-                file_path = root_path / file
-                try:
-                    file_path.unlink()
-                    print(f"Deleted: {file_path}")
-                except Exception as e:
-                    print(f"Error deleting {file_path}: {str(e)}")
+    
+    def delete_index(entry: os.DirEntry) -> Optional[bool]:
+        if not entry.name.endswith('.index'):
+            return None
+        try:
+            os.unlink(entry.path)
+            if VERBOSE:
+                logger.info(f"Deleted: {entry.path}")
+            return True
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error deleting {entry.path}: {str(e)}")
+        return None
+    
+    deleted = parallel_walk(directory, delete_index)
+    print(f"Deleted {len(deleted)} .index files")
 
 def convert_iso_to_epoch(timestamp_str: str) -> Optional[int]:
     """Convert ISO format timestamp to epoch (Unix timestamp)."""
@@ -345,10 +416,11 @@ def convert_iso_to_epoch(timestamp_str: str) -> Optional[int]:
     except (ValueError, TypeError):
         return None
 
-def add_epoch_timestamps(file_path: Path, timestamp_keys: List[str]) -> None:
+def add_epoch_timestamps(file_path: Path, timestamp_keys: List[str]) -> bool:
     """
     Add epoch timestamps for specified keys in JSON files.
     The timestamp must be in ISO format: "2025-06-04T20:08:02Z"
+    Returns True if the file was rewritten.
     """
     try:
         # Read all lines from the file
@@ -376,18 +448,21 @@ def add_epoch_timestamps(file_path: Path, timestamp_keys: List[str]) -> None:
                 updated_lines.append(line)
         
         # Write the updated lines back to the file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(updated_lines) + '\n')
+        write_json_lines(file_path, updated_lines)
         
-        print(f"Added epoch timestamps in: {file_path.name}")
+        if VERBOSE:
+            logger.info(f"Added epoch timestamps in: {file_path.name}")
+        return True
         
     except Exception as e:
         print(f"Error adding epoch timestamps in {file_path.name}: {str(e)}")
+        return False
 
-def detect_and_convert_timestamps(file_path: Path, possible_time_keys: List[str]) -> None:
+def detect_and_convert_timestamps(file_path: Path, time_indicators: Tuple[str, ...]) -> bool:
     """
     Automatically detect and convert timestamp values based on key names.
-    Looks for keys containing words from possible_time_keys list and attempts to convert their values to epoch.
+    Looks for keys containing any of the lowercase time_indicators and attempts to convert their values to epoch.
+    Returns True if any conversions were made.
     """
     try:
         # Read all lines from the file
@@ -398,25 +473,38 @@ def detect_and_convert_timestamps(file_path: Path, possible_time_keys: List[str]
         updated_lines = []
         conversions_made = False
         
+        # Candidate timestamp keys per key layout; lines of a results file
+        # almost always share the first line's columns, so this is computed once
+        candidates_by_layout: Dict[Tuple[str, ...], List[str]] = {}
+        
         for line in lines:
             try:
                 # Parse the JSON object from the line
                 json_obj = json.loads(line)
                 
-                # Process each key in the JSON object
-                for key in list(json_obj.keys()):  # Create a list to avoid modification during iteration
-                    # Check if key contains any of the possible time indicators
-                    if any(time_indicator.lower() in key.lower() for time_indicator in possible_time_keys):
-                        # Skip if we already created an epoch version for this key
-                        if f"{key}_epoch" in json_obj:
-                            continue
-                            
-                        # Try to convert if the value is a string
-                        if isinstance(json_obj[key], str):
-                            epoch_time = convert_iso_to_epoch(json_obj[key])
-                            if epoch_time is not None:
-                                json_obj[f"{key}_epoch"] = epoch_time
-                                conversions_made = True
+                layout = tuple(json_obj)
+                candidate_keys = candidates_by_layout.get(layout)
+                if candidate_keys is None:
+                    candidate_keys = [
+                        key for key in layout
+                        if any(time_indicator in key.lower() for time_indicator in time_indicators)
+                    ]
+                    candidates_by_layout[layout] = candidate_keys
+                
+                # Only keys containing a time indicator can hold timestamps
+                for key in candidate_keys:
+                    # Skip if we already created an epoch version for this key
+                    epoch_key = f"{key}_epoch"
+                    if epoch_key in json_obj:
+                        continue
+                    
+                    # Try to convert if the value is a string
+                    value = json_obj[key]
+                    if isinstance(value, str):
+                        epoch_time = convert_iso_to_epoch(value)
+                        if epoch_time is not None:
+                            json_obj[epoch_key] = epoch_time
+                            conversions_made = True
                 
                 # Convert back to JSON string
                 updated_lines.append(json.dumps(json_obj))
@@ -426,12 +514,14 @@ def detect_and_convert_timestamps(file_path: Path, possible_time_keys: List[str]
         
         # Write the updated lines back to the file only if changes were made
         if conversions_made:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(updated_lines) + '\n')
-            print(f"Auto-detected and converted timestamps in: {file_path.name}")
+            write_json_lines(file_path, updated_lines)
+            if VERBOSE:
+                logger.info(f"Auto-detected and converted timestamps in: {file_path.name}")
+        return conversions_made
         
     except Exception as e:
         print(f"Error auto-detecting timestamps in {file_path.name}: {str(e)}")
+        return False
 
 def process_single_zip(zip_path: Path, runtime_zip_dir: Path) -> None:
     """
@@ -470,6 +560,7 @@ def process_single_zip(zip_path: Path, runtime_zip_dir: Path) -> None:
         "ctime",
         "atime"
     ]
+    time_indicators = tuple(time_key.lower() for time_key in possible_time_keys)
     
     print(f"\nProcessing: {zip_path.name}")
     
@@ -477,10 +568,10 @@ def process_single_zip(zip_path: Path, runtime_zip_dir: Path) -> None:
     process_file_info(zip_path)
     
     # Step 2: Set up extraction directory
-    dest_path, extract_dir = setup_extraction_directory(zip_path, runtime_zip_dir)
+    extract_dir = setup_extraction_directory(zip_path, runtime_zip_dir)
     
     # Step 3: Extract zip file
-    if not extract_zip_file(dest_path, extract_dir):
+    if not extract_zip_file(zip_path, extract_dir):
         print(f"Failed to extract {zip_path.name}")
         return
     
@@ -500,102 +591,101 @@ def process_single_zip(zip_path: Path, runtime_zip_dir: Path) -> None:
     if results_dir.exists():
         # Step 7: Add epoch timestamps for known keys
         print("\nAdding epoch timestamps for known keys...")
+        epoch_count = 0
         for file_path in results_dir.glob('*.json'):
             if file_path.name != 'Generic.Client.Info.BasicInformation.json':
-                add_epoch_timestamps(file_path, timestamp_keys)
+                epoch_count += add_epoch_timestamps(file_path, timestamp_keys)
+        print(f"Added epoch timestamps in {epoch_count} files")
         
         # Step 8: Auto-detect and convert additional timestamps
         print("\nAuto-detecting and converting additional timestamps...")
+        converted_count = 0
         for file_path in results_dir.glob('*.json'):
             if file_path.name != 'Generic.Client.Info.BasicInformation.json':
-                detect_and_convert_timestamps(file_path, possible_time_keys)
+                converted_count += detect_and_convert_timestamps(file_path, time_indicators)
+        print(f"Auto-detected and converted timestamps in {converted_count} files")
     
     # Step 9: Delete .index files
     delete_index_files(extract_dir)
 
-def check_process_single_zip(zip_path: Path, runtime_zip_dir: Path) -> None:
+def check_process_single_zip(zip_path: Path, runtime_zip_dir: Path) -> bool:
     """
     Validate that all JSON files in the extracted directory have the required keys.
     Only prints issues found during validation.
+    Returns True if no issues were found.
     """
     print(f"\nValidating processed files for: {zip_path.name}")
     
-    # Define required keys that should be present in each JSON line
-    required_keys = {
-        'source_type',
-        'Hostname',
-        'OS',
-        'Platform',
-        'PlatformVersion',
-        'Fqdn',
-        'MACAddresses'
-    }
-    
     extract_dir = runtime_zip_dir / zip_path.stem
     results_dir = extract_dir / 'results'
     
     if not results_dir.exists():
         print(f"Error: Results directory not found for {zip_path.name}")
-        return
+        return False
     
-    basic_info_filename = 'Generic.Client.Info.BasicInformation.json'
     issues_found = False
     
-    # Process each JSON file
-    for file_path in results_dir.glob('*.json'):
-        # Skip the BasicInformation.json file
-        if file_path.name == basic_info_filename:
-            continue
-            
-        try:
-            # Read the file line by line
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = [line.strip() for line in f if line.strip()]
+    # Process each JSON file, reading names straight from the directory instead of globbing Paths
+    with os.scandir(results_dir) as entries:
+        for entry in entries:
+            file_name = entry.name
+            # Skip the BasicInformation.json file
+            if not file_name.endswith('.json') or file_name in EXCLUDED_RESULT_FILES:
+                continue
+        
+            expected_source_type = get_source_type(file_name)
             
-            # Check each line
-            for line_number, line in enumerate(lines, 1):
-                try:
-                    json_obj = json.loads(line)
+            try:
+                # Parse each non-empty line as it is read instead of holding the whole file as a list
+                with open(entry.path, 'rb') as f:
+                    non_empty_lines = (line for line in f if not line.isspace())
+                    for line_number, line in enumerate(non_empty_lines, 1):
+                        try:
+                            json_obj = json.loads(line)
                     
-                    # Verify source_type matches filename
-                    expected_source_type = get_source_type(file_path.name)
-                    actual_source_type = json_obj.get('source_type')
-                    if actual_source_type != expected_source_type:
-                        issues_found = True
-                        print(f"Issue in {file_path.name}, line {line_number}:")
-                        print(f"  - Incorrect source_type: expected '{expected_source_type}', got '{actual_source_type}'")
+                            # Verify source_type matches filename
+                            actual_source_type = json_obj.get('source_type')
+                            if actual_source_type != expected_source_type:
+                                issues_found = True
+                                print(f"Issue in {file_name}, line {line_number}:")
+                                print(f"  - Incorrect source_type: expected '{expected_source_type}', got '{actual_source_type}'")
                     
-                    # Check for missing required keys
-                    missing_keys = required_keys - set(json_obj.keys())
-                    if missing_keys:
-                        issues_found = True
-                        print(f"Issue in {file_path.name}, line {line_number}:")
-                        print(f"  - Missing required keys: {', '.join(sorted(missing_keys))}")
+                            # Check for missing required keys
+                            missing_keys = REQUIRED_KEYS.difference(json_obj.keys())
+                            if missing_keys:
+                                issues_found = True
+                                print(f"Issue in {file_name}, line {line_number}:")
+                                print(f"  - Missing required keys: {', '.join(sorted(missing_keys))}")
                     
-                    # Check for empty or None values in required keys
-                    empty_keys = {
-                        key for key in required_keys - missing_keys
-                        if json_obj.get(key) is None or json_obj.get(key) == ''
-                    }
-                    if empty_keys:
-                        issues_found = True
-                        print(f"Issue in {file_path.name}, line {line_number}:")
-                        print(f"  - Empty values for keys: {', '.join(sorted(empty_keys))}")
+                            # Check for empty or None values in required keys
+                            empty_keys = [
+                                key for key in REQUIRED_KEYS
+                                if key not in missing_keys and json_obj[key] in (None, '')
+                            ]
+                            if empty_keys:
+                                issues_found = True
+                                print(f"Issue in {file_name}, line {line_number}:")
+                                print(f"  - Empty values for keys: {', '.join(sorted(empty_keys))}")
                     
-                except json.JSONDecodeError:
-                    issues_found = True
-                    print(f"Issue in {file_path.name}, line {line_number}:")
-                    print("  - Invalid JSON format")
+                        except json.JSONDecodeError:
+                            issues_found = True
+                            print(f"Issue in {file_name}, line {line_number}:")
+                            print("  - Invalid JSON format")
                     
-        except Exception as e:
-            issues_found = True
-            print(f"Error processing {file_path.name}: {str(e)}")
+            except Exception as e:
+                issues_found = True
+                print(f"Error processing {file_name}: {str(e)}")
     
     if not issues_found:
         print(f"Validation successful: No issues found in {zip_path.name}")
+    
+    return not issues_found
 
-def process_zip_files():
-    """Main function to process all zip files."""
+def process_zip_files(validate: bool = True):
+    """
+    Main function to process all zip files.
+    Validation re-reads every results file, so it can be skipped with validate=False.
+    """
     # Setup directories
     runtime_zip_dir = Path('runtime_zip')
     runtime_dir = Path('runtime')
@@ -618,7 +708,14 @@ def process_zip_files():
     for zip_path in zip_files:
         process_single_zip(zip_path, runtime_zip_dir)
         # Validate the processing
-        check_process_single_zip(zip_path, runtime_zip_dir)
+        if validate:
+            check_process_single_zip(zip_path, runtime_zip_dir)
 
 if __name__ == "__main__":
-    process_zip_files() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='Process Velociraptor collection zip files')
+    parser.add_argument('--no-validate', action='store_true',
+                        help='Skip validating the processed JSON files')
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format='%(message)s', handlers=[logging.StreamHandler(sys.stdout)])
+    process_zip_files(validate=not args.no_validate) 
\ No newline at end of file
@@ -0,0 +1,332 @@
+import os
+import winrm
+import paramiko
+import hashlib
+import mmap
+import json
+import threading
+import weakref
+import time
+from concurrent.futures import ThreadPoolExecutor
+from config import Config
+from colors import print_success, print_error, print_info, print_warning, SUCCESS_EMOJI, ERROR_EMOJI
+
+# Read size for hashing when the file cannot be memory-mapped and hashlib.file_digest is unavailable
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# SFTP channel window and packet sizes; larger values mean fewer round-trips per MB
+SFTP_WINDOW_SIZE = 2 ** 27
+SFTP_MAX_PACKET_SIZE = 2 ** 19
+SFTP_READ_BUFFER_SIZE = 1024 * 1024
+
+# Bulk cipher and MAC preference for SSH; AES-GCM when this paramiko supports it, then AES-CTR
+# with encrypt-then-MAC, all of which run on AES-NI/SHA extensions through OpenSSL
+SSH_PREFERRED_CIPHERS = ('aes128-gcm@openssh.com', 'aes256-gcm@openssh.com', 'aes128-ctr', 'aes256-ctr')
+SSH_PREFERRED_MACS = ('hmac-sha2-256-etm@openssh.com', 'hmac-sha2-256')
+
+# Minimum seconds between upload progress lines
+PROGRESS_INTERVAL = 1.0
+
+# Longest the remote execution script waits for its output file to appear
+OUTPUT_WAIT_SECONDS = 10
+
+# Files pulled at once by pull_files_by_pattern, each over its own SFTP channel
+PULL_WORKERS = 4
+
+class PersistentShellSession(winrm.Session):
+    """
+    WinRM session that opens one remote shell and runs every command in it.
+    winrm.Session creates and deletes a shell around each command, which costs two extra
+    WSMan round-trips per run_ps call. The shell is closed when the session is garbage
+    collected or the interpreter exits, and reopened if the server has discarded it.
+    """
+    def __init__(self, target, auth, **kwargs):
+        super().__init__(target, auth, **kwargs)
+        self._shell_id = None
+        self._shell_finalizer = None
+
+    def _open_shell(self):
+        self._shell_id = self.protocol.open_shell()
+        self._shell_finalizer = weakref.finalize(self, self.protocol.close_shell, self._shell_id)
+
+    def close(self):
+        """Close the remote shell, if one is open"""
+        if self._shell_finalizer is not None:
+            self._shell_finalizer()
+        self._shell_id = None
+        self._shell_finalizer = None
+
+    def run_cmd(self, command, args=()):
+        if self._shell_id is None:
+            self._open_shell()
+        try:
+            command_id = self.protocol.run_command(self._shell_id, command, args)
+        except winrm.exceptions.WinRMError:
+            # The shell may have hit its idle timeout on the server; start a fresh one
+            self._shell_finalizer.detach()
+            self._open_shell()
+            command_id = self.protocol.run_command(self._shell_id, command, args)
+        try:
+            return winrm.Response(self.protocol.get_command_output(self._shell_id, command_id))
+        finally:
+            self.protocol.cleanup_command(self._shell_id, command_id)
+
+def create_winrm_session(credentials):
+    """Create a WinRM session with the provided credentials"""
+    return PersistentShellSession(
+        credentials['host'],
+        auth=(credentials['username'], credentials['password']),
+        transport='ntlm',  # Using NTLM authentication
+        server_cert_validation='ignore'  # Ignore SSL certificate validation
+    )
+
+def create_ssh_transport(sock, **kwargs):
+    """paramiko transport factory that negotiates the preferred ciphers and MACs first"""
+    transport = paramiko.Transport(sock, **kwargs)
+    options = transport.get_security_options()
+    # Unsupported names are dropped and the remaining defaults kept so older servers still connect
+    for name, preferred in (('ciphers', SSH_PREFERRED_CIPHERS), ('digests', SSH_PREFERRED_MACS)):
+        current = getattr(options, name)
+        first = tuple(algorithm for algorithm in preferred if algorithm in current)
+        setattr(options, name, first + tuple(algorithm for algorithm in current if algorithm not in first))
+    return transport
+
+def open_ssh_client(credentials):
+    """Connect an SSH client with the provided credentials; raises if the connection fails"""
+    ssh = paramiko.SSHClient()
+    ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    ssh.connect(
+        credentials['host'],
+        port=int(credentials.get('ssh_port', 22)),
+        username=credentials['username'],
+        password=credentials['password'],
+        transport_factory=create_ssh_transport
+    )
+    # Every SFTP channel opened on this connection (uploads and pulls) gets the large window
+    transport = ssh.get_transport()
+    transport.default_window_size = SFTP_WINDOW_SIZE
+    transport.default_max_packet_size = SFTP_MAX_PACKET_SIZE
+    return ssh
+
+def execute_command(session, command):
+    """Execute a command on the remote host using WinRM"""
+    result = session.run_ps(command)  # Using PowerShell
+    return {
+        'status_code': result.status_code,
+        'stdout': result.std_out.decode('utf-8'),
+        'stderr': result.std_err.decode('utf-8') if result.std_err else ''
+    }
+
+def check_execution_output(output_file):
+    """
+    Check if the execution was successful by looking for 'Exiting' in the output file
+    """
+    try:
+        with open(output_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+            if "Exiting" in content:
+                print_success(f"{SUCCESS_EMOJI} Execution verification passed: Found 'Exiting' in output")
+                return True
+            else:
+                print_error(f"{ERROR_EMOJI} Execution verification failed: 'Exiting' not found in output")
+                return False
+    except Exception as e:
+        print_error(f"{ERROR_EMOJI} Failed to read output file: {str(e)}")
+        return False
+
+def new_sha256(data=b""):
+    """Create a SHA256 hash object from the OpenSSL backend, which uses SHA-NI where the CPU has it"""
+    # These hashes are integrity checks, not security boundaries, so FIPS-restricted builds may skip their checks
+    return hashlib.new("sha256", data, usedforsecurity=False)
+
+class HashingReader:
+    """File wrapper that feeds every block read through it into a SHA256 hash"""
+    def __init__(self, file_obj):
+        self.file_obj = file_obj
+        self.sha256_hash = new_sha256()
+
+    def read(self, size=-1):
+        data = self.file_obj.read(size)
+        self.sha256_hash.update(data)
+        return data
+
+    def hexdigest(self):
+        return self.sha256_hash.hexdigest()
+
+def open_for_sequential_read(file_path):
+    """Open a file unbuffered and hint the OS that it will be read front to back once"""
+    # O_SEQUENTIAL maps to FILE_FLAG_SEQUENTIAL_SCAN on Windows and does not exist elsewhere
+    f = open(file_path, "rb", buffering=0,
+             opener=lambda path, flags: os.open(path, flags | getattr(os, "O_SEQUENTIAL", 0)))
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+    return f
+
+# Serialises reads and writes of the hash cache file between hashing threads
+_hash_cache_lock = threading.Lock()
+
+def _load_hash_cache(cache_path):
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def lookup_cached_hash(file_path):
+    """Return the cached SHA256 of a file if its mtime and size are unchanged, otherwise None"""
+    stat = os.stat(file_path)
+    with _hash_cache_lock:
+        entry = _load_hash_cache(Config.get('HASH_CACHE_FILE')).get(os.path.abspath(file_path))
+    if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+        return entry[2]
+    return None
+
+def store_cached_hash(file_path, digest):
+    """Record the SHA256 of a file against its current mtime and size"""
+    stat = os.stat(file_path)
+    cache_path = Config.get('HASH_CACHE_FILE')
+    try:
+        with _hash_cache_lock:
+            cache = _load_hash_cache(cache_path)
+            cache[os.path.abspath(file_path)] = [stat.st_mtime_ns, stat.st_size, digest]
+            os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+            tmp_path = f"{cache_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print_warning(f"Could not update hash cache: {str(e)}")
+
+def get_file_hash(file_path):
+    """Calculate SHA256 hash of a file, reusing the cached value while the file is unchanged"""
+    digest = lookup_cached_hash(file_path)
+    if digest is None:
+        digest = compute_file_hash(file_path)
+        store_cached_hash(file_path, digest)
+    return digest
+
+def compute_file_hash(file_path):
+    """Calculate SHA256 hash of a file"""
+    with open_for_sequential_read(file_path) as f:
+        # Map the file and hash it with a single update call; empty files cannot be mapped
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                return new_sha256(mapped).hexdigest()
+        except (OSError, ValueError):
+            pass
+
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: the whole read/update loop runs in C
+            return hashlib.file_digest(f, new_sha256).hexdigest()
+
+        # Reuse one large buffer instead of allocating a bytes object per chunk
+        sha256_hash = new_sha256()
+        buffer = bytearray(HASH_CHUNK_SIZE)
+        view = memoryview(buffer)
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            sha256_hash.update(view[:size])
+    return sha256_hash.hexdigest()
+
+def get_remote_file_hash(session, file_path):
+    """Get SHA256 hash of a file on the remote Windows system"""
+    ps_command = f"""
+    $hash = Get-FileHash -Path '{file_path}' -Algorithm SHA256
+    $hash.Hash.ToLower()
+    """
+    result = session.run_ps(ps_command)
+    if result.status_code == 0:
+        return result.std_out.decode('utf-8').strip()
+    return None
+
+def get_remote_file_details(session, file_path):
+    """Get (size, lowercase SHA256) of a file on the remote Windows system in one round-trip, or None if it is missing"""
+    result = session.run_ps(
+        f"if (Test-Path -LiteralPath '{file_path}' -PathType Leaf) {{ "
+        f"$i = Get-Item -LiteralPath '{file_path}'; "
+        f"$h = Get-FileHash -LiteralPath '{file_path}' -Algorithm SHA256; "
+        '"$($i.Length)`n$($h.Hash.ToLower())" }'
+    )
+    if result.status_code != 0:
+        return None
+    # Size and hex digest are ASCII, so parse the raw bytes and only decode the hash
+    remote_lines = result.std_out.split()
+    if len(remote_lines) != 2:
+        return None
+    return int(remote_lines[0]), remote_lines[1].decode('ascii')
+
+def verify_file_integrity(winrm_session, local_path, remote_path, local_hash=None, local_size=None):
+    """Verify file integrity by comparing size and hash (local_hash and local_size may be precomputed)"""
+    try:
+        # Get local file details
+        if local_size is None:
+            local_size = os.path.getsize(local_path)
+
+        # Get remote size and hash in a single WinRM round-trip, hashing the local file
+        # meanwhile unless the caller already has its hash
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            hash_future = executor.submit(get_file_hash, local_path) if local_hash is None else None
+            remote_details = get_remote_file_details(winrm_session, remote_path)
+            if hash_future is not None:
+                local_hash = hash_future.result()
+        if not remote_details:
+            print_error(f"{ERROR_EMOJI} Failed to get remote file details")
+            return False
+        remote_size, remote_hash = remote_details
+
+        # Compare sizes
+        if local_size != remote_size:
+            print_error(f"{ERROR_EMOJI} Size verification failed: Local {local_size:,} bytes, Remote {remote_size:,} bytes")
+            return False
+
+        if local_hash.lower() != remote_hash.lower():
+            print_error(f"{ERROR_EMOJI} Hash verification failed")
+            return False
+
+        print_success(f"{SUCCESS_EMOJI} File integrity verified (SHA256: {local_hash})")
+        return True
+
+    except Exception as e:
+        print_error(f"{ERROR_EMOJI} Verification failed: {str(e)}")
+        return False
+
+def upload_and_verify_file(winrm_session, sftp, local_path, remote_path):
+    """
+    Copy a file to the remote host over an open SFTP session and verify its presence.
+    """
+    try:
+        # Get file size
+        file_size = os.path.getsize(local_path)
+
+        print_info(f"Copying file to {remote_path}...")
+        print_info(f"File size: {file_size / (1024*1024):.2f} MB")
+
+        # Paramiko calls back for every chunk; report at most once per PROGRESS_INTERVAL and on completion
+        last_report = time.monotonic()
+        def progress_callback(sent, total):
+            nonlocal last_report
+            now = time.monotonic()
+            if now - last_report >= PROGRESS_INTERVAL or sent == total:
+                last_report = now
+                print_info(f"Progress: {sent/total*100:.1f}%")
+
+        # Copy the file, hashing the bytes as they are sent so the file is only read once
+        with open(local_path, "rb", buffering=SFTP_READ_BUFFER_SIZE) as local_file:
+            reader = HashingReader(local_file)
+            sftp.putfo(reader, remote_path, file_size, callback=progress_callback)
+        local_hash = reader.hexdigest()
+        store_cached_hash(local_path, local_hash)
+
+        # Verify file integrity
+        return verify_file_integrity(winrm_session, local_path, remote_path, local_hash, file_size)
+
+    except Exception as e:
+        print_error(f"{ERROR_EMOJI} File transfer failed: {str(e)}")
+        return False
@@ -1,5 +1,5 @@
 import sys
-import subprocess
+import importlib
 import time
 from pathlib import Path
 import os
@@ -11,36 +11,50 @@ def print_header(message):
     print_info(f"== {message}")
     print_info(f"{'='*80}\n")
 
-def run_script(script_name):
+def run_script(script_name, entry_point="main"):
     """
-    Run a Python script and return True if it succeeds, False otherwise
+    Run a Python script and return True if it succeeds, False otherwise.
+    The script is imported and its entry_point called in this interpreter, which
+    avoids a fresh Python startup per step.
     """
+    saved_argv = sys.argv
+    saved_cwd = os.getcwd()
     try:
         print_info(f"Running {script_name}...")
-        result = subprocess.run([sys.executable, script_name], check=True)
-        return result.returncode == 0
-    except subprocess.CalledProcessError as e:
-        print_error(f"Error running {script_name}: {str(e)}")
-        return False
+        module = importlib.import_module(Path(script_name).stem)
+        sys.argv = [script_name]
+        getattr(module, entry_point)()
+        return True
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            print_error(f"Error running {script_name}: exited with {e.code}")
+            return False
+        return True
     except Exception as e:
         print_error(f"Unexpected error running {script_name}: {str(e)}")
         return False
+    finally:
+        sys.argv = saved_argv
+        os.chdir(saved_cwd)
 
 def check_runtime_directory():
     """
     Check if runtime directory exists and has zip files
     """
-    runtime_dir = Path("runtime")
-    if not runtime_dir.exists():
+    try:
+        # DirEntry caches the file type, so no extra stat per entry
+        with os.scandir("runtime") as it:
+            zip_count = sum(1 for entry in it
+                            if entry.name.endswith(".zip") and entry.is_file(follow_symlinks=False))
+    except FileNotFoundError:
         print_error("Runtime directory not found")
         return False
     
-    zip_files = list(runtime_dir.glob("*.zip"))
-    if not zip_files:
+    if not zip_count:
         print_error("No zip files found in runtime directory")
         return False
     
-    print_success(f"Found {len(zip_files)} zip file(s) in runtime directory")
+    print_success(f"Found {zip_count} zip file(s) in runtime directory")
     return True
 
 def main():
@@ -68,7 +82,7 @@ def main():
     
     # Step 2: Run process_zip_files.py
     print_header("Step 2: Processing Collection Files")
-    if not run_script("process_zip_files.py"):
+    if not run_script("process_zip_files.py", entry_point="process_zip_files"):
         print_error("Processing zip files failed.")
         return
     
@@ -1,10 +1,24 @@
 import os
 import sys
 import shutil
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple, List, Optional
-from config import Config, init_directories
+from config import Config, init_directories, is_verbose
+from text_utils import sniff_encoding
 from colors import print_success, print_error, print_info, print_warning, SUCCESS_EMOJI, ERROR_EMOJI
 
+# Lines in the template that delimit the artifacts section
+START_MARKER = "The list of artifacts and their args."
+END_MARKER = "Can be ZIP"
+
+# Per-spec detail lines are only printed when VERBOSE is enabled
+VERBOSE = is_verbose()
+
+# Number of threads writing spec files in generate_all_specs and process_artifacts
+SPEC_WRITE_WORKERS = 16
+
 def clean_all_directories():
     """Clean all working directories: testing_specs, runtime_zip, and runtime"""
     directories = [
@@ -16,7 +30,16 @@ def clean_all_directories():
     for directory in directories:
         try:
             if os.path.exists(directory):
-                shutil.rmtree(directory)
+                # Move the old tree aside so the fresh directory is usable immediately,
+                # and delete the stale contents in the background
+                stale_dir = f"{directory}.old.{os.getpid()}"
+                try:
+                    os.rename(directory, stale_dir)
+                except OSError:
+                    shutil.rmtree(directory)
+                else:
+                    threading.Thread(target=shutil.rmtree, args=(stale_dir,),
+                                     kwargs={'ignore_errors': True}).start()
                 print_success(f"Cleaned {directory} directory")
             os.makedirs(directory)
             print_success(f"Created fresh {directory} directory")
@@ -31,73 +54,126 @@ class SpecFileGenerator:
         self.artifacts_path = artifacts_path
         self.output_dir = output_dir
         self.template_encoding = None
+        self._template_cache = None
 
-    def try_read_file(self, file_path: str) -> Tuple[Optional[List[str]], Optional[str]]:
-        """Try to read a file with different encodings."""
+    def try_read_file(self, file_path: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Read a file into a single string, choosing the encoding from its byte order mark.
+        UTF-16 and UTF-8 files are recognised by their BOM; anything else is decoded as UTF-8,
+        falling back to latin1 which accepts any byte sequence. Line endings are normalised to "\n".
+        """
         print_info(f"\nAttempting to read {file_path}")
         
-        # First try UTF-16
         try:
-            with open(file_path, 'r', encoding='utf-16') as f:
-                lines = f.readlines()
-                print_success(f"Successfully read {len(lines)} lines with UTF-16")
-                return lines, 'utf-16'
-        except UnicodeError:
-            pass
-
-        # Then try other encodings
-        for encoding in ['utf-8', 'latin1', 'ascii']:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+        except Exception as e:
+            print_error(f"Error reading file {file_path}: {e}")
+            return None, None
+
+        encoding = sniff_encoding(data)
+        encodings = [encoding] if encoding == 'utf-16' else [encoding, 'latin1']
+
+        for encoding in encodings:
             try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    lines = f.readlines()
-                    print_success(f"Successfully read {len(lines)} lines with {encoding}")
-                    return lines, encoding
+                text = data.decode(encoding)
             except UnicodeDecodeError:
                 continue
-            except Exception as e:
-                print_error(f"Error reading file {file_path}: {e}")
+            # Same newline translation a text-mode read would apply
+            if "\r" in text:
+                text = text.replace("\r\n", "\n").replace("\r", "\n")
+            print_success(f"Successfully read {len(text)} characters with {encoding}")
+            return text, encoding
         
         print_error(f"Failed to read {file_path} with any encoding")
         return None, None
 
-    def find_section_markers(self, lines: List[str]) -> Tuple[int, int]:
-        """Find the start and end markers in the template."""
-        start = -1
-        end = -1
+    def read_artifacts(self) -> Optional[List[str]]:
+        """
+        Read the artifact names from the artifacts file, one per line.
+        Artifact names contain no whitespace, so a single split() over the decoded
+        file replaces per-line readlines() and strip().
+        """
+        try:
+            with open(self.artifacts_path, 'rb') as f:
+                data = f.read()
+        except Exception as e:
+            print_error(f"Error reading file {self.artifacts_path}: {e}")
+            return None
+
+        return data.decode(sniff_encoding(data), 'ignore').split()
+
+    def find_section_markers(self, text: str) -> Tuple[int, int]:
+        """
+        Find the artifacts section in the template text.
+        Returns (header_end, footer_start) offsets: the header runs through the start marker
+        line and the "Artifacts:" line after it, the footer starts at the end marker line.
+        Both are -1 if the markers are missing.
+        """
+        start = text.find(START_MARKER)
+        marker_line_end = text.find("\n", start) if start != -1 else -1
+        if marker_line_end == -1:
+            return -1, -1
+        # The end marker must be on a later line than the start marker
+        end = text.find(END_MARKER, marker_line_end + 1)
+        if end == -1:
+            return -1, -1
+        # The last start marker before the end marker opens the section
+        start = text.rfind(START_MARKER, 0, end)
         
-        for i, line in enumerate(lines):
-            if "The list of artifacts and their args." in line:
-                start = i
-            elif "Can be ZIP" in line:
-                end = i
-                break
+        marker_line_end = text.find("\n", start)
+        artifacts_line_end = text.find("\n", marker_line_end + 1)
+        header_end = len(text) if artifacts_line_end == -1 else artifacts_line_end + 1
+        footer_start = text.rfind("\n", 0, end) + 1
         
-        return start, end
+        return header_end, footer_start
+
+    def load_template(self) -> Optional[Tuple[str, str]]:
+        """
+        Read the template and split it into (header, footer) text around the artifacts section.
+        The result is cached, so specs for many artifacts only read and scan the template once.
+        """
+        if self._template_cache is None:
+            template_text, self.template_encoding = self.try_read_file(self.template_path)
+            if not template_text:
+                return None
+
+            header_end, footer_start = self.find_section_markers(template_text)
+            if header_end == -1 or footer_start == -1:
+                print_error("Error: Could not find section markers in template")
+                return None
 
-    def create_spec_file(self, artifact: str, header_lines: List[str], 
-                        footer_lines: List[str]) -> str:
+            self._template_cache = (template_text[:header_end], template_text[footer_start:])
+        return self._template_cache
+
+    def create_spec_file(self, artifact: str, header: str, footer: str) -> str:
         """Create a spec file for a single artifact."""
         try:
             # Create the new content
-            new_content = header_lines.copy()
-            new_content.append(f" {artifact}:\n")
-            new_content.append("    All: Y\n")
-            new_content.append(" Generic.Client.Info:\n")
-            new_content.append("    All: Y\n")
-            new_content.extend(footer_lines)
+            new_content = (f"{header}"
+                           f" {artifact}:\n"
+                           "    All: Y\n"
+                           " Generic.Client.Info:\n"
+                           "    All: Y\n"
+                           f"{footer}")
             
             # Create a more descriptive filename
             clean_artifact_name = artifact.replace('.', '_')
             spec_filename = f"single_artifact_spec_{clean_artifact_name}.yaml"
             spec_path = os.path.join(self.output_dir, spec_filename)
             
-            print_info(f"\nCreating spec file: {spec_path}")
-            print_info(f"Content length: {len(new_content)} lines")
+            if VERBOSE:
+                line_count = new_content.count("\n")
+                print_info(f"\nCreating spec file: {spec_path}")
+                print_info(f"Content length: {line_count} lines")
             
-            with open(spec_path, 'w', newline='', encoding=self.template_encoding) as spec_file:
-                spec_file.writelines(new_content)
+            # Encode the whole spec in one codec call and write it with a single syscall
+            payload = new_content.encode(self.template_encoding or 'utf-8')
+            with open(spec_path, 'wb') as spec_file:
+                spec_file.write(payload)
             
-            print_success(f"Successfully created spec file for {artifact}")
+            if VERBOSE:
+                print_success(f"Created spec file for {artifact}: {spec_path}")
             return spec_path
         except Exception as e:
             print_error(f"Error creating spec file for {artifact}: {e}")
@@ -107,9 +183,11 @@ class SpecFileGenerator:
         """Generate spec files for all artifacts."""
         try:
             # Create output directory if it doesn't exist
-            if not os.path.exists(self.output_dir):
+            try:
                 os.makedirs(self.output_dir)
                 print_success(f"Created directory: {self.output_dir}")
+            except FileExistsError:
+                pass
 
             # Validate input files
             for path in [self.template_path, self.artifacts_path]:
@@ -117,38 +195,29 @@ class SpecFileGenerator:
                     print_error(f"Error: File not found: {path}")
                     return 0
 
-            # Read template file
-            template_lines, self.template_encoding = self.try_read_file(self.template_path)
-            if not template_lines:
-                return 0
-
-            # Find section markers
-            start, end = self.find_section_markers(template_lines)
-            if start == -1 or end == -1:
-                print_error("Error: Could not find section markers in template")
+            # Read and split template
+            template = self.load_template()
+            if not template:
                 return 0
-
-            # Split template
-            header_lines = template_lines[:start + 2]  # Include the marker and "Artifacts:" line
-            footer_lines = template_lines[end:]
+            header, footer = template
 
             # Read artifacts
-            artifacts_lines, _ = self.try_read_file(self.artifacts_path)
-            if not artifacts_lines:
+            artifacts = self.read_artifacts()
+            if artifacts is None:
                 return 0
-
-            artifacts = [line.strip() for line in artifacts_lines if line.strip()]
             if not artifacts:
                 print_error("Error: No artifacts found in the artifacts file")
                 return 0
 
             print_info(f"\nFound {len(artifacts)} artifacts to process")
 
-            # Create spec files
-            created_files = 0
-            for artifact in artifacts:
-                if self.create_spec_file(artifact, header_lines, footer_lines):
-                    created_files += 1
+            # Create spec files; each one is independent, so encoding and writes overlap across threads
+            with ThreadPoolExecutor(max_workers=SPEC_WRITE_WORKERS) as executor:
+                spec_paths = executor.map(
+                    lambda artifact: self.create_spec_file(artifact, header, footer),
+                    artifacts
+                )
+                created_files = sum(1 for spec_path in spec_paths if spec_path)
 
             print_info(f"\nSummary:")
             print_success(f"Total artifacts processed: {len(artifacts)}")
@@ -167,6 +236,12 @@ class CollectorManager:
     def __init__(self, velociraptor_path: str, remote_host: str):
         self.velociraptor_path = velociraptor_path
         self.remote_host = remote_host
+        
+        # Build settings are read once rather than on every collector build
+        self.server_config = Config.get('VELO_SERVER_CONFIG')
+        self.datastore = Config.get('VELO_DATASTORE')
+        self.collectors_dir = Config.get('ARTIFACT_COLLECTORS_DIR')
+        os.makedirs(self.collectors_dir, exist_ok=True)
 
     def create_collector(self, spec_path: str) -> str:
         """
@@ -177,32 +252,27 @@ class CollectorManager:
             # Get the filename without extension
             spec_name = os.path.splitext(os.path.basename(spec_path))[0]
             
-            # Create output directory for collectors if it doesn't exist
-            collectors_dir = Config.get('ARTIFACT_COLLECTORS_DIR')
-            if not os.path.exists(collectors_dir):
-                os.makedirs(collectors_dir)
-            
             # The collector will be created in the collectors directory
-            collector_path = os.path.join(collectors_dir, f"{spec_name}_collector.exe")
-            
-            # Get server config path from environment
-            server_config = Config.get('VELO_SERVER_CONFIG')
-            datastore = Config.get('VELO_DATASTORE')
+            collector_path = os.path.join(self.collectors_dir, f"{spec_name}_collector.exe")
             
-            # Build the command
-            cmd = f"{self.velociraptor_path} --config {server_config} collector --datastore {datastore} {spec_path}"
+            # Build the command as an argument list so nothing goes through a shell
+            cmd = [self.velociraptor_path, "--config", self.server_config,
+                   "collector", "--datastore", self.datastore, spec_path]
             
             print(f"\nCreating collector for {spec_path}")
-            print(f"Command: {cmd}")
+            print(f"Command: {' '.join(cmd)}")
             
-            # Execute the command
-            result = os.system(cmd)
+            # Execute the command, letting Velociraptor write straight to our stdout/stderr
+            # so build progress shows as it happens. close_fds=False lets CPython use
+            # posix_spawn instead of fork+exec (our own fds are non-inheritable anyway)
+            sys.stdout.flush()
+            proc = subprocess.run(cmd, close_fds=False)
             
-            if result == 0:
+            if proc.returncode == 0:
                 print(f"Successfully created collector: {collector_path}")
                 return collector_path
             else:
-                print(f"Failed to create collector. Exit code: {result}")
+                print(f"Failed to create collector. Exit code: {proc.returncode}")
                 return ""
                 
         except Exception as e:
@@ -249,32 +319,18 @@ def print_usage():
     print("    # Create and build collectors for multiple artifacts:")
     print("    python test_one_by_one.py --test-artifact Windows.Sys.AllUsers,Windows.Sys.Users --build")
 
-def create_artifact_spec(artifact_name: str, spec_generator: SpecFileGenerator) -> str:
-    """Create a spec file for a single artifact."""
+def create_artifact_spec(artifact_name: str, spec_generator: SpecFileGenerator, header: str, footer: str) -> str:
+    """Create a spec file for a single artifact from the already loaded template parts."""
     try:
-        print_info(f"\n{SUCCESS_EMOJI} Creating spec file for artifact: {artifact_name}")
-        
-        # Read template and create spec
-        template_lines, encoding = spec_generator.try_read_file(spec_generator.template_path)
-        if not template_lines:
-            print_error("Failed to read template file")
-            return ""
-
-        start, end = spec_generator.find_section_markers(template_lines)
-        if start == -1 or end == -1:
-            print_error("Error: Could not find section markers in template")
-            return ""
-
-        header_lines = template_lines[:start + 2]
-        footer_lines = template_lines[end:]
+        if VERBOSE:
+            print_info(f"\n{SUCCESS_EMOJI} Creating spec file for artifact: {artifact_name}")
 
         # Create spec file
-        spec_path = spec_generator.create_spec_file(artifact_name, header_lines, footer_lines)
+        spec_path = spec_generator.create_spec_file(artifact_name, header, footer)
         if not spec_path:
             print_error(f"Failed to create spec file for {artifact_name}")
             return ""
 
-        print_success(f"Successfully created spec file: {spec_path}")
         return spec_path
 
     except Exception as e:
@@ -311,16 +367,31 @@ def process_artifacts(artifacts: List[str], spec_generator: SpecFileGenerator,
                      collector_manager: Optional[CollectorManager] = None) -> bool:
     """Process a list of artifacts - create specs and optionally build collectors."""
     success_count = 0
+    artifacts = [artifact_name.strip() for artifact_name in artifacts]
     total_artifacts = len(artifacts)
 
-    for artifact_name in artifacts:
-        artifact_name = artifact_name.strip()
-        print_info(f"\nProcessing artifact ({artifacts.index(artifact_name) + 1}/{total_artifacts}): {artifact_name}")
+    # Spec files are independent of each other, so write them all up front across threads.
+    # Collector builds stay sequential: they share the datastore and the runtime directory.
+    # The template is loaded once here so a failure is reported once, not by every worker
+    template = spec_generator.load_template()
+    if not template:
+        print_error("Failed to read template file")
+        return False
+    header, footer = template
+    
+    # Workers only print errors; the per-artifact result is reported below, in order
+    with ThreadPoolExecutor(max_workers=SPEC_WRITE_WORKERS) as executor:
+        spec_paths = list(executor.map(
+            lambda artifact_name: create_artifact_spec(artifact_name, spec_generator, header, footer),
+            artifacts
+        ))
+
+    for idx, (artifact_name, spec_path) in enumerate(zip(artifacts, spec_paths), 1):
+        print_info(f"\nProcessing artifact ({idx}/{total_artifacts}): {artifact_name}")
         
-        # Create spec file
-        spec_path = create_artifact_spec(artifact_name, spec_generator)
         if not spec_path:
             continue
+        print_success(f"Successfully created spec file: {spec_path}")
 
         # Build collector if requested
         if collector_manager:
@@ -1,170 +1,59 @@
 import os
-import winrm
 import paramiko
-import hashlib
 import warnings
 import shutil
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from config import Config, init_directories, get_winrm_credentials
 from colors import print_success, print_error, print_info, print_warning, SUCCESS_EMOJI, ERROR_EMOJI
 from cryptography.utils import CryptographyDeprecationWarning
+from remote_utils import (
+    create_winrm_session, open_ssh_client, execute_command, check_execution_output,
+    upload_and_verify_file, OUTPUT_WAIT_SECONDS, PULL_WORKERS
+)
 
 # Suppress deprecation warnings
 warnings.filterwarnings('ignore', category=CryptographyDeprecationWarning)
 warnings.filterwarnings('ignore', message='.*TripleDES.*')
 
-def create_winrm_session(credentials):
-    """Create a WinRM session with the provided credentials"""
-    return winrm.Session(
-        credentials['host'],
-        auth=(credentials['username'], credentials['password']),
-        transport='ntlm',  # Using NTLM authentication
-        server_cert_validation='ignore'  # Ignore SSL certificate validation
-    )
-
 def create_ssh_client(credentials):
     """Create and return a configured SSH client"""
-    ssh = paramiko.SSHClient()
-    ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
     try:
-        ssh.connect(
-            credentials['host'],
-            port=credentials['ssh_port'],
-            username=credentials['username'],
-            password=credentials['password']
-        )
-        return ssh
+        return open_ssh_client(credentials)
     except Exception as e:
         print(f"[ERROR] Failed to establish SSH connection: {str(e)}")
         return None
 
-def execute_command(session, command):
-    """Execute a command on the remote host using WinRM"""
-    result = session.run_ps(command)  # Using PowerShell
-    return {
-        'status_code': result.status_code,
-        'stdout': result.std_out.decode('utf-8'),
-        'stderr': result.std_err.decode('utf-8')
-    }
-
-def check_execution_output(output_file):
+@contextmanager
+def sftp_session(credentials):
     """
-    Check if the execution was successful by looking for 'Exiting' in the output file
+    Open one SSH connection and SFTP channel for a whole run and close both afterwards.
+    Yields None if the SSH connection cannot be established.
     """
+    ssh = create_ssh_client(credentials)
+    if not ssh:
+        yield None
+        return
     try:
-        with open(output_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            if "Exiting" in content:
-                print_success(f"{SUCCESS_EMOJI} Execution verification passed: Found 'Exiting' in output")
-                return True
-            else:
-                print_error(f"{ERROR_EMOJI} Execution verification failed: 'Exiting' not found in output")
-                return False
-    except Exception as e:
-        print_error(f"{ERROR_EMOJI} Failed to read output file: {str(e)}")
-        return False
+        sftp = ssh.open_sftp()
+        try:
+            yield sftp
+        finally:
+            sftp.close()
+    finally:
+        ssh.close()
 
 def verify_output(output, expected_value):
     """Verify if the command output matches the expected value"""
-    actual = output['stdout'].strip().lower()
-    expected = expected_value.lower()
+    actual = output['stdout'].strip()
     
-    if actual == expected:
+    # Outputs of a different length cannot match the (ASCII) expected value, so only
+    # lowercase when the lengths agree
+    if len(actual) == len(expected_value) and actual.lower() == expected_value.lower():
         print(f"{SUCCESS_EMOJI} Test passed: Output matches expected value '{expected_value}'")
         return True
     else:
-        print(f"{ERROR_EMOJI} Test failed: Expected '{expected_value}', got '{output['stdout'].strip()}'")
-        return False
-
-def get_file_hash(file_path):
-    """Calculate SHA256 hash of a file"""
-    sha256_hash = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        # Read the file in chunks to handle large files efficiently
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
-    return sha256_hash.hexdigest()
-
-def get_remote_file_hash(session, file_path):
-    """Get SHA256 hash of a file on the remote Windows system"""
-    ps_command = f"""
-    $hash = Get-FileHash -Path '{file_path}' -Algorithm SHA256
-    $hash.Hash.ToLower()
-    """
-    result = session.run_ps(ps_command)
-    if result.status_code == 0:
-        return result.std_out.decode('utf-8').strip()
-    return None
-
-def verify_file_integrity(winrm_session, local_path, remote_path):
-    """Verify file integrity by comparing size and hash"""
-    try:
-        # Get local file details
-        local_size = os.path.getsize(local_path)
-        local_hash = get_file_hash(local_path)
-        
-        # Get remote file details using WinRM
-        size_result = winrm_session.run_ps(f'(Get-Item "{remote_path}").Length')
-        if size_result.status_code != 0:
-            print_error(f"{ERROR_EMOJI} Failed to get remote file size")
-            return False
-            
-        remote_size = int(size_result.std_out.decode('utf-8').strip())
-        
-        # Compare sizes
-        if local_size != remote_size:
-            print_error(f"{ERROR_EMOJI} Size verification failed: Local {local_size:,} bytes, Remote {remote_size:,} bytes")
-            return False
-        
-        # Get and compare hashes
-        remote_hash = get_remote_file_hash(winrm_session, remote_path)
-        
-        if not remote_hash:
-            print_error(f"{ERROR_EMOJI} Failed to get remote file hash")
-            return False
-            
-        if local_hash.lower() != remote_hash.lower():
-            print_error(f"{ERROR_EMOJI} Hash verification failed")
-            return False
-            
-        print_success(f"{SUCCESS_EMOJI} File integrity verified (SHA256: {local_hash})")
-        return True
-        
-    except Exception as e:
-        print_error(f"{ERROR_EMOJI} Verification failed: {str(e)}")
-        return False
-
-def copy_and_verify_file(winrm_session, credentials, local_path, remote_path):
-    """
-    Copy a file to the remote host using SSH/SCP and verify its presence
-    """
-    try:
-        print(f"Copying file to {remote_path}...")
-        
-        # Create SSH client
-        ssh = create_ssh_client(credentials)
-        if not ssh:
-            return False
-            
-        try:
-            # Create SFTP client
-            sftp = ssh.open_sftp()
-            
-            # Get file size
-            file_size = os.path.getsize(local_path)
-            print(f"File size: {file_size / (1024*1024):.2f} MB")
-            
-            # Copy the file
-            sftp.put(local_path, remote_path, callback=lambda sent, total: print(f"Progress: {sent/total*100:.1f}%") if sent % (1024*1024) == 0 else None)
-            
-            # Verify file integrity
-            return verify_file_integrity(winrm_session, local_path, remote_path)
-                
-        finally:
-            sftp.close()
-            ssh.close()
-            
-    except Exception as e:
-        print(f"[ERROR] File transfer failed: {str(e)}")
+        print(f"{ERROR_EMOJI} Test failed: Expected '{expected_value}', got '{actual}'")
         return False
 
 def clean_runtime_directory():
@@ -173,37 +62,30 @@ def clean_runtime_directory():
     """
     runtime_dir = "./runtime"
     try:
-        # Create directory if it doesn't exist
-        if not os.path.exists(runtime_dir):
-            os.makedirs(runtime_dir)
+        # Remove the whole tree in one call and recreate it, rather than stat'ing every entry
+        existed = True
+        try:
+            shutil.rmtree(runtime_dir)
+        except FileNotFoundError:
+            existed = False
+        os.makedirs(runtime_dir, exist_ok=True)
+        
+        if existed:
+            print_success(f"{SUCCESS_EMOJI} Cleaned runtime directory")
+        else:
             print_success(f"{SUCCESS_EMOJI} Created clean runtime directory")
-            return True
-            
-        # Remove all files in the directory
-        for filename in os.listdir(runtime_dir):
-            file_path = os.path.join(runtime_dir, filename)
-            try:
-                if os.path.isfile(file_path):
-                    os.unlink(file_path)
-                elif os.path.isdir(file_path):
-                    shutil.rmtree(file_path)
-            except Exception as e:
-                print_error(f"{ERROR_EMOJI} Failed to remove {file_path}: {str(e)}")
-                return False
-                
-        print_success(f"{SUCCESS_EMOJI} Cleaned runtime directory")
         return True
         
     except Exception as e:
         print_error(f"{ERROR_EMOJI} Failed to clean runtime directory: {str(e)}")
         return False
 
-def pull_files_by_pattern(session, credentials, remote_pattern, local_dir="./runtime"):
+def pull_files_by_pattern(session, sftp, remote_pattern, local_dir="./runtime"):
     """
     Pull files matching a pattern from remote system
     Args:
         session: WinRM session
-        credentials: Credentials for SSH connection
+        sftp: Open SFTP session to download with
         remote_pattern: File pattern to match (e.g., "C:\\path\\Collection-*.zip")
         local_dir: Local directory to save files
     """
@@ -226,46 +108,43 @@ def pull_files_by_pattern(session, credentials, remote_pattern, local_dir="./run
             print_warning(f"{YELLOW}No files found matching pattern: {remote_pattern}{RESET}")
             return False
             
-        # Create SSH client for file transfer
-        ssh = create_ssh_client(credentials)
-        if not ssh:
-            return False
-            
-        try:
-            # Create SFTP client
-            sftp = ssh.open_sftp()
-            
-            # Download each file
-            for remote_path in files:
-                try:
-                    local_filename = os.path.basename(remote_path)
-                    local_path = os.path.join(local_dir, local_filename)
-                    
-                    print_info(f"\nPulling file {remote_path}...")
+        def pull(remote_path):
+            try:
+                local_filename = os.path.basename(remote_path)
+                local_path = os.path.join(local_dir, local_filename)
+                
+                print_info(f"\nPulling file {remote_path}...")
+                if len(files) == 1:
                     sftp.get(remote_path, local_path)
-                    print_success(f"{SUCCESS_EMOJI} File pulled successfully to {local_path}")
-                except Exception as e:
-                    print_error(f"{ERROR_EMOJI} Failed to pull {remote_path}: {str(e)}")
-                    continue
-                    
-            return True
+                else:
+                    # Concurrent downloads each get their own SFTP channel on the shared connection
+                    channel_sftp = paramiko.SFTPClient.from_transport(sftp.get_channel().get_transport())
+                    try:
+                        channel_sftp.get(remote_path, local_path)
+                    finally:
+                        channel_sftp.close()
+                print_success(f"{SUCCESS_EMOJI} File pulled successfully to {local_path}")
+            except Exception as e:
+                print_error(f"{ERROR_EMOJI} Failed to pull {remote_path}: {str(e)}")
+        
+        # Download the files, several at a time
+        with ThreadPoolExecutor(max_workers=min(PULL_WORKERS, len(files))) as executor:
+            list(executor.map(pull, files))
                 
-        finally:
-            sftp.close()
-            ssh.close()
+        return True
             
     except Exception as e:
         print_error(f"{ERROR_EMOJI} Failed to pull files: {str(e)}")
         return False
 
-def execute_remote_exe(session, exe_path, file_to_pull, credentials):
+def execute_remote_exe(session, exe_path, file_to_pull, sftp):
     """
     Execute the remote exe file and pull back the specified result file
     Args:
         session: WinRM session
         exe_path: Path to the executable on remote system
         file_to_pull: Path to the file that should be pulled back after execution
-        credentials: Credentials for SSH connection
+        sftp: Open SFTP session to download with
     """
     try:
         print_info(f"\nExecuting {exe_path}...")
@@ -287,7 +166,10 @@ def execute_remote_exe(session, exe_path, file_to_pull, credentials):
                 throw "Process exited with code $LASTEXITCODE"
             }}
             
-            "Success"
+            # Poll for the output file server-side so a late handle release costs no extra round-trip
+            $deadline = (Get-Date).AddSeconds({OUTPUT_WAIT_SECONDS})
+            while (-not (Test-Path -LiteralPath '{file_to_pull}') -and (Get-Date) -lt $deadline) {{ Start-Sleep -Milliseconds 100 }}
+            if (Test-Path -LiteralPath '{file_to_pull}') {{ "Success" }} else {{ "OutputMissing" }}
         }} catch {{
             Write-Error "Failed to execute: $_"
             throw
@@ -295,18 +177,14 @@ def execute_remote_exe(session, exe_path, file_to_pull, credentials):
         """
         
         result = session.run_ps(ps_command)
+        output = result.std_out.decode('utf-8')
+        
+        if result.status_code == 0 and "OutputMissing" in output:
+            print_error(f"{ERROR_EMOJI} File {file_to_pull} not found after execution")
+            return False
         
-        if result.status_code == 0 and "Success" in result.std_out.decode('utf-8'):
+        if result.status_code == 0 and "Success" in output:
             print_success(f"{SUCCESS_EMOJI} Execution completed")
-            
-            # Wait a moment to ensure file is ready
-            session.run_ps("Start-Sleep -Seconds 2")
-            
-            # Check if the file exists before trying to pull it
-            check_file = session.run_ps(f"Test-Path '{file_to_pull}'")
-            if check_file.std_out.decode('utf-8').strip().lower() != 'true':
-                print_error(f"{ERROR_EMOJI} File {file_to_pull} not found after execution")
-                return False
                 
             print_info(f"\nPulling file {file_to_pull}...")
             
@@ -314,36 +192,23 @@ def execute_remote_exe(session, exe_path, file_to_pull, credentials):
             if not clean_runtime_directory():
                 return False
             
-            # Create SSH client for file transfer
-            ssh = create_ssh_client(credentials)
-            if not ssh:
-                return False
-                
-            try:
-                # Create SFTP client
-                sftp = ssh.open_sftp()
-                
-                # Get the filename from the path and create full local path
-                local_filename = os.path.basename(file_to_pull)
-                local_path = os.path.join("./runtime", local_filename)
-                
-                # Download the file
-                sftp.get(file_to_pull, local_path)
-                print_success(f"{SUCCESS_EMOJI} File pulled successfully to {local_path}")
-                
-                # Check the output file
-                print_info("\nVerifying execution output...")
-                if check_execution_output(local_path):
-                    # After successful log file pull, pull the collection zip files
-                    print_info("\nPulling Collection zip files...")
-                    collection_pattern = "C:\\Windows\\Temp\\Collection-*.zip"
-                    pull_files_by_pattern(session, credentials, collection_pattern)
-                    return True
-                return False
-                
-            finally:
-                sftp.close()
-                ssh.close()
+            # Get the filename from the path and create full local path
+            local_filename = os.path.basename(file_to_pull)
+            local_path = os.path.join("./runtime", local_filename)
+            
+            # Download the file
+            sftp.get(file_to_pull, local_path)
+            print_success(f"{SUCCESS_EMOJI} File pulled successfully to {local_path}")
+            
+            # Check the output file
+            print_info("\nVerifying execution output...")
+            if check_execution_output(local_path):
+                # After successful log file pull, pull the collection zip files
+                print_info("\nPulling Collection zip files...")
+                collection_pattern = "C:\\Windows\\Temp\\Collection-*.zip"
+                pull_files_by_pattern(session, sftp, collection_pattern)
+                return True
+            return False
         else:
             error_msg = result.std_err.decode('utf-8') if result.std_err else result.std_out.decode('utf-8')
             print_error(f"{ERROR_EMOJI} Execution failed: {error_msg}")
@@ -441,11 +306,15 @@ def main():
             # Copy and verify the Velociraptor collector file
             local_file = credentials['local_file']
             remote_file = "C:\\Windows\\Temp\\Collector_velociraptor.exe"
-            print("\nStarting file copy operation...")
-            if copy_and_verify_file(winrm_session, credentials, local_file, remote_file):
-                # If file copy and verification succeeded, execute the file and pull back result
-                file_to_pull = "C:\\Windows\\Temp\\Collector_velociraptor-v0.72.4-windows-amd64.exe.log"
-                execute_remote_exe(winrm_session, remote_file, file_to_pull, credentials)
+            # One SSH connection carries the upload and every pull
+            with sftp_session(credentials) as sftp:
+                if not sftp:
+                    return
+                print("\nStarting file copy operation...")
+                if upload_and_verify_file(winrm_session, sftp, local_file, remote_file):
+                    # If file copy and verification succeeded, execute the file and pull back result
+                    file_to_pull = "C:\\Windows\\Temp\\Collector_velociraptor-v0.72.4-windows-amd64.exe.log"
+                    execute_remote_exe(winrm_session, remote_file, file_to_pull, sftp)
         else:
             print(f"Command failed with error: {result['stderr']}")
     
@@ -0,0 +1,27 @@
+import unittest
+
+from process_zip_files import collect_system_info, extract_system_info
+
+
+class ExtractSystemInfoTest(unittest.TestCase):
+    def test_last_value_wins(self):
+        data = {'Hostname': None, 'rows': [{'Hostname': 'A'}, {'Hostname': 'B'}]}
+        self.assertEqual(extract_system_info(data), {'Hostname': 'B'})
+
+    def test_last_none_value_wins(self):
+        data = {'rows': [{'OS': 'windows'}], 'OS': None}
+        self.assertEqual(extract_system_info(data), {'OS': None})
+
+
+class CollectSystemInfoTest(unittest.TestCase):
+    def test_nested_value_before_later_sibling(self):
+        data = {'info': {'Hostname': 'inner'}, 'Hostname': 'outer'}
+        self.assertEqual(collect_system_info(data), {'Hostname': 'inner'})
+
+    def test_first_non_none_value_wins(self):
+        data = {'Hostname': None, 'rows': [{'Hostname': 'A'}, {'Hostname': 'B'}]}
+        self.assertEqual(collect_system_info(data), {'Hostname': 'A'})
+
+
+if __name__ == '__main__':
+    unittest.main()
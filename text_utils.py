@@ -0,0 +1,8 @@
+def sniff_encoding(data: bytes) -> str:
+    """Pick the encoding of file contents from their byte order mark, defaulting to UTF-8."""
+    if data[:3] == b'\xef\xbb\xbf':
+        # utf-8-sig drops the BOM on decode and writes it back on encode
+        return 'utf-8-sig'
+    if data[:2] in (b'\xff\xfe', b'\xfe\xff'):
+        return 'utf-16'
+    return 'utf-8'
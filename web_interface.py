@@ -1,4 +1,4 @@
-from flask import Flask, render_template, request, jsonify, send_from_directory, safe_join, send_file, make_response
+from flask import Flask, Response, render_template, request, jsonify, send_from_directory, safe_join, send_file, make_response
 import os
 import json
 from collector_manager import CollectorManager
@@ -7,10 +7,13 @@ import threading
 import time
 import argparse
 import ssl
-from OpenSSL import crypto
+from cryptography import x509
+from cryptography.x509.oid import NameOID
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
 from pathlib import Path
-from typing import Dict, Any, List
-from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
 import logging
 
 app = Flask(__name__)
@@ -19,24 +22,61 @@ app.logger.setLevel(logging.INFO)
 # Global collector manager instance
 collector_manager = None
 
+# Longest /events waits for a status change before sending a fresh snapshot anyway
+STATUS_EVENT_TIMEOUT = 5.0
+
+# Parsed profiles keyed on path, reused while the file's mtime and size are unchanged
+_profile_cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+_profile_cache_lock = threading.Lock()
+
 def load_profiles() -> List[Dict[str, Any]]:
     """Load artifact collection profiles from the profiles directory"""
     profiles = []
-    profiles_dir = 'profiles'
-    if os.path.exists(profiles_dir):
-        for filename in os.listdir(profiles_dir):
-            if filename.endswith('.json'):
+    try:
+        entries = os.scandir('profiles')
+    except FileNotFoundError:
+        with _profile_cache_lock:
+            _profile_cache.clear()
+        return profiles
+    seen = set()
+    with entries, _profile_cache_lock:
+        for entry in entries:
+            if entry.name.endswith('.json'):
+                seen.add(entry.path)
                 try:
-                    with open(os.path.join(profiles_dir, filename), 'r') as f:
+                    stat = entry.stat()
+                    cached = _profile_cache.get(entry.path)
+                    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                        profiles.append(cached[2])
+                        continue
+                    with open(entry.path, 'r') as f:
                         profile = json.load(f)
-                        profile['id'] = os.path.splitext(filename)[0]
+                        profile['id'] = os.path.splitext(entry.name)[0]
                         profiles.append(profile)
+                    _profile_cache[entry.path] = (stat.st_mtime_ns, stat.st_size, profile)
                 except Exception as e:
-                    print(f"Error loading profile {filename}: {e}")
+                    print(f"Error loading profile {entry.name}: {e}")
+        # Drop profiles whose files have been removed
+        for path in _profile_cache.keys() - seen:
+            del _profile_cache[path]
     return profiles
 
-def get_runtime_stats() -> Dict[str, Any]:
-    """Get runtime statistics from the collector manager"""
+def get_profile(profile_id: str) -> Dict[str, Any]:
+    """Load a single profile by id, reusing the copy parsed by load_profiles while the file is unchanged"""
+    path = os.path.join('profiles', f'{profile_id}.json')
+    stat = os.stat(path)
+    with _profile_cache_lock:
+        cached = _profile_cache.get(path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        with open(path, 'r') as f:
+            profile = json.load(f)
+        profile['id'] = profile_id
+        _profile_cache[path] = (stat.st_mtime_ns, stat.st_size, profile)
+    return profile
+
+def get_runtime_stats(stats: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Get runtime statistics from the collector manager, or from a status snapshot already taken from it"""
     if not collector_manager:
         return {
             'artifacts_processed': 0,
@@ -45,17 +85,15 @@ def get_runtime_stats() -> Dict[str, Any]:
             'average_execution_time': 0
         }
     
-    stats = collector_manager.get_status()
+    if stats is None:
+        stats = collector_manager.get_status()
     successful = len(stats['artifact_stats']['successful'])
     failed = len(stats['artifact_stats']['failed'])
     total = successful + failed
     
     if total > 0:
         success_rate = (successful / total) * 100
-        total_time = sum(
-            artifact['execution_time'] 
-            for artifact in stats['artifact_stats']['successful'] + stats['artifact_stats']['failed']
-        )
+        total_time = stats['artifact_execution_time']
         avg_time = total_time / total
     else:
         success_rate = 0
@@ -98,7 +136,8 @@ def start_processing():
     host = request.form.get('host')
 
     # Log the received parameters
-    app.logger.info(f"Received processing request - Profile: {profile_id}, Build Collectors: {build_collectors}, Mode: {mode}, Host: {host}")
+    app.logger.info("Received processing request - Profile: %s, Build Collectors: %s, Mode: %s, Host: %s",
+                    profile_id, build_collectors, mode, host)
 
     # Validate host selection
     if not host:
@@ -126,10 +165,9 @@ def start_processing():
     artifacts = []
     if profile_id:
         try:
-            with open(os.path.join('profiles', f'{profile_id}.json'), 'r') as f:
-                profile = json.load(f)
-                artifacts = profile.get('artifacts', [])
-                app.logger.info(f"Loaded artifacts from profile {profile_id}: {artifacts}")
+            profile = get_profile(profile_id)
+            artifacts = profile.get('artifacts', [])
+            app.logger.info("Loaded artifacts from profile %s: %s", profile_id, artifacts)
         except Exception as e:
             error_msg = f'Error loading profile: {str(e)}'
             app.logger.error(error_msg)
@@ -137,7 +175,7 @@ def start_processing():
     else:
         artifacts = request.form.get('artifacts', '').split(',')
         artifacts = [a.strip() for a in artifacts if a.strip()]
-        app.logger.info(f"Using manually specified artifacts: {artifacts}")
+        app.logger.info("Using manually specified artifacts: %s", artifacts)
 
     if not artifacts:
         return jsonify({'error': 'No artifacts specified'})
@@ -145,7 +183,7 @@ def start_processing():
     try:
         # Create new collector manager instance
         collector_manager = CollectorManager(mode=mode)
-        app.logger.info(f"Created new CollectorManager instance with mode: {mode}")
+        app.logger.info("Created new CollectorManager instance with mode: %s", mode)
         
         # Start processing in background thread
         thread = threading.Thread(
@@ -155,7 +193,7 @@ def start_processing():
         thread.daemon = True
         thread.start()
 
-        app.logger.info(f"Started processing thread with {len(artifacts)} artifacts and build_collectors={build_collectors}")
+        app.logger.info("Started processing thread with %d artifacts and build_collectors=%s", len(artifacts), build_collectors)
 
         return jsonify({
             'status': 'started',
@@ -169,12 +207,10 @@ def start_processing():
         app.logger.error(error_msg)
         return jsonify({'error': error_msg})
 
-@app.route('/status')
-def get_status():
-    """Get current processing status and statistics"""
-    global collector_manager
+def build_status_payload() -> Dict[str, Any]:
+    """Build the processing status and statistics served by /status and /events"""
     if not collector_manager:
-        return jsonify({
+        return {
             'processing': False,
             'total_artifacts': 0,
             'processed': 0,
@@ -187,11 +223,37 @@ def get_status():
                 'failed': []
             },
             'runtime_stats': get_runtime_stats()
-        })
+        }
     
     status = collector_manager.get_status()
-    status['runtime_stats'] = get_runtime_stats()
-    return jsonify(status)
+    status['runtime_stats'] = get_runtime_stats(status)
+    return status
+
+@app.route('/status')
+def get_status():
+    """Get current processing status and statistics"""
+    return jsonify(build_status_payload())
+
+@app.route('/events')
+def status_events():
+    """Stream the /status payload as Server-Sent Events, sending a new one whenever progress is reported"""
+    manager = collector_manager
+    
+    def generate():
+        version = 0
+        while True:
+            # Read the version before taking the snapshot so a change made meanwhile still wakes the wait below
+            if manager:
+                version = manager.status_version
+            payload = build_status_payload()
+            yield f"data: {json.dumps(payload, separators=(',', ':'))}\n\n"
+            if not manager or (payload['completed'] and not payload['processing']):
+                return
+            # Every stream waits on the manager's status version, so one change wakes them all;
+            # the timeout still sends a snapshot now and then for changes made without a notification
+            manager.wait_for_status_change(version, STATUS_EVENT_TIMEOUT)
+    
+    return Response(generate(), mimetype='text/event-stream', headers={'Cache-Control': 'no-cache'})
 
 @app.route('/cleanup', methods=['POST'])
 def cleanup():
@@ -305,7 +367,10 @@ def cleanup():
 @app.route('/results/<path:filename>')
 def download_result(filename):
     """Download processed result files"""
-    return send_from_directory('runtime_zip', filename)
+    # Let browsers reuse a result for a minute and revalidate it with ETag/Last-Modified afterwards
+    response = send_from_directory('runtime_zip', filename, conditional=True, etag=True, max_age=60)
+    response.cache_control.public = True
+    return response
 
 @app.route('/stop', methods=['POST'])
 def stop_processing():
@@ -378,16 +443,13 @@ def start_profile_testing():
         # Get artifacts from selected profiles
         artifacts = []
         for profile_id in profiles:
-            profile_path = os.path.join('profiles', f'{profile_id}.json')
-            if not os.path.exists(profile_path):
-                return jsonify({'error': f'Profile not found: {profile_id}'}), 404
-                
             try:
-                with open(profile_path, 'r') as f:
-                    profile = json.load(f)
-                    profile_artifacts = profile.get('artifacts', [])
-                    app.logger.info(f"Loaded artifacts from profile {profile_id}: {profile_artifacts}")
-                    artifacts.extend(profile_artifacts)
+                profile = get_profile(profile_id)
+                profile_artifacts = profile.get('artifacts', [])
+                app.logger.info(f"Loaded artifacts from profile {profile_id}: {profile_artifacts}")
+                artifacts.extend(profile_artifacts)
+            except FileNotFoundError:
+                return jsonify({'error': f'Profile not found: {profile_id}'}), 404
             except json.JSONDecodeError as e:
                 return jsonify({'error': f'Invalid JSON in profile {profile_id}: {str(e)}'}), 400
             except Exception as e:
@@ -598,27 +660,37 @@ def test_profile_status():
 
 def create_self_signed_cert(cert_file: str, key_file: str) -> None:
     """Create self-signed SSL certificate"""
-    k = crypto.PKey()
-    k.generate_key(crypto.TYPE_RSA, 2048)
-
-    cert = crypto.X509()
-    cert.get_subject().C = "US"
-    cert.get_subject().ST = "State"
-    cert.get_subject().L = "City"
-    cert.get_subject().O = "Organization"
-    cert.get_subject().OU = "Organizational Unit"
-    cert.get_subject().CN = "localhost"
-    cert.set_serial_number(1000)
-    cert.gmtime_adj_notBefore(0)
-    cert.gmtime_adj_notAfter(365*24*60*60)  # Valid for one year
-    cert.set_issuer(cert.get_subject())
-    cert.set_pubkey(k)
-    cert.sign(k, 'sha256')
+    # P-256 keys generate far faster than RSA-2048 and give equivalent strength
+    k = ec.generate_private_key(ec.SECP256R1())
+
+    subject = x509.Name([
+        x509.NameAttribute(NameOID.COUNTRY_NAME, "US"),
+        x509.NameAttribute(NameOID.STATE_OR_PROVINCE_NAME, "State"),
+        x509.NameAttribute(NameOID.LOCALITY_NAME, "City"),
+        x509.NameAttribute(NameOID.ORGANIZATION_NAME, "Organization"),
+        x509.NameAttribute(NameOID.ORGANIZATIONAL_UNIT_NAME, "Organizational Unit"),
+        x509.NameAttribute(NameOID.COMMON_NAME, "localhost"),
+    ])
+    not_before = datetime.now(timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(subject)
+        .issuer_name(subject)
+        .public_key(k.public_key())
+        .serial_number(1000)
+        .not_valid_before(not_before)
+        .not_valid_after(not_before + timedelta(days=365))  # Valid for one year
+        .sign(k, hashes.SHA256())
+    )
 
     with open(cert_file, "wb") as f:
-        f.write(crypto.dump_certificate(crypto.FILETYPE_PEM, cert))
+        f.write(cert.public_bytes(serialization.Encoding.PEM))
     with open(key_file, "wb") as f:
-        f.write(crypto.dump_privatekey(crypto.FILETYPE_PEM, k))
+        f.write(k.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption()
+        ))
 
 def initialize_app():
     """Initialize application directories and settings"""
@@ -717,7 +789,7 @@ def find_latest_collector(
             return None
             
         # Return the most recently modified collector file
-        latest_collector = sorted(collector_files, key=lambda x: x[1], reverse=True)[0][0]
+        latest_collector = max(collector_files, key=lambda x: x[1])[0]
         app.logger.info(f"Latest matching file is: {latest_collector}")
         return latest_collector
         
@@ -864,6 +936,7 @@ if __name__ == '__main__':
     parser.add_argument('--ssl', action='store_true', help='Enable SSL/HTTPS')
     parser.add_argument('--port', type=int, default=5000, help='Port to run on')
     parser.add_argument('--host', type=str, default='0.0.0.0', help='Host to bind to')
+    parser.add_argument('--debug', action='store_true', help='Enable the Flask reloader and interactive debugger')
     args = parser.parse_args()
 
     if not initialize_app():
@@ -874,23 +947,30 @@ if __name__ == '__main__':
         cert_file = "cert.pem"
         key_file = "key.pem"
         
-        if not (os.path.exists(cert_file) and os.path.exists(key_file)):
-            print("SSL certificates not found. Creating self-signed certificates...")
-            create_self_signed_cert(cert_file, key_file)
-            print("Self-signed certificates created successfully.")
+        # With --debug the first process only supervises the reloader and never serves;
+        # Werkzeug marks the serving child with WERKZEUG_RUN_MAIN
+        if args.debug and os.environ.get('WERKZEUG_RUN_MAIN') != 'true':
+            ssl_context = (cert_file, key_file)
+        else:
+            if not (os.path.exists(cert_file) and os.path.exists(key_file)):
+                print("SSL certificates not found. Creating self-signed certificates...")
+                create_self_signed_cert(cert_file, key_file)
+                print("Self-signed certificates created successfully.")
 
-        ssl_context = ssl.create_default_context(purpose=ssl.Purpose.CLIENT_AUTH)
-        ssl_context.load_cert_chain(certfile=cert_file, keyfile=key_file)
+            ssl_context = ssl.create_default_context(purpose=ssl.Purpose.CLIENT_AUTH)
+            ssl_context.load_cert_chain(certfile=cert_file, keyfile=key_file)
         
         app.run(
             host=args.host,
             port=args.port,
             ssl_context=ssl_context,
-            debug=True
+            debug=args.debug,
+            threaded=True
         )
     else:
         app.run(
             host=args.host,
             port=args.port,
-            debug=True
+            debug=args.debug,
+            threaded=True
         ) 
\ No newline at end of file